@@ -0,0 +1,73 @@
+"""
+Mscene: Koch Curve Benchmark
+
+Times KochCurve construction against the copy, rotate and arrange build it replaced.
+Cold builds clear the level cache first, cached builds reuse the cached points.
+
+python benchmarks/koch_curve.py --levels 0 9 --legacy 7
+"""
+
+import argparse
+import time
+
+from manim import *
+from mscene.plugins import *
+
+
+def legacy_koch_curve(level, length=config.frame_width * 3 / 4, point=ORIGIN):
+    l = length / (3**level)
+    vmob = VMobject().set_points_as_corners([LEFT * l / 2, RIGHT * l / 2])
+    for _ in range(level):
+        new_vmob = VGroup()
+        for i in (0, PI / 3, -PI / 3, 0):
+            new_vmob.add(vmob.copy().rotate(i))
+        new_vmob.arrange(RIGHT, buff=0, aligned_edge=DOWN)
+        vmob.become(new_vmob)
+    vmob.move_to(point)
+    return VMobject().set_points(vmob.get_all_points())
+
+
+def best_time(func, *args, repeat=3, setup=None):
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--levels", nargs=2, type=int, default=(0, 9))
+    parser.add_argument("--legacy", type=int, default=7, help="highest legacy level")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'level':>5} {'points':>9} {'legacy (s)':>11} {'cold (s)':>10}"
+        f" {'cached (s)':>11} {'speedup':>8}"
+    )
+
+    for level in range(args.levels[0], args.levels[1] + 1):
+        points = KochCurve(level).get_num_points()
+        cold = best_time(
+            KochCurve, level, repeat=args.repeat, setup=LSystem.cache.clear
+        )
+        cached = best_time(KochCurve, level, repeat=args.repeat)
+        if level <= args.legacy:
+            old = best_time(legacy_koch_curve, level, repeat=args.repeat)
+            print(
+                f"{level:>5} {points:>9} {old:>11.4f} {cold:>10.4f}"
+                f" {cached:>11.4f} {old / cold:>7.1f}x"
+            )
+        else:
+            print(
+                f"{level:>5} {points:>9} {'-':>11} {cold:>10.4f}"
+                f" {cached:>11.4f} {'-':>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
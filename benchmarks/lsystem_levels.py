@@ -0,0 +1,53 @@
+"""
+Mscene: L-System Levels Benchmark
+
+Times the turn expansion and cold builds of L-system levels of millions of steps.
+
+python benchmarks/lsystem_levels.py --repeat 3
+"""
+
+import argparse
+import time
+
+from manim import *
+from mscene.fractal import _lsystem_corners
+from mscene.plugins import *
+
+LEVELS = [(KochCurve, 10), (LevyCurve, 20), (DragonCurve, 20), (HilbertCurve, 10)]
+
+
+def best_time(func, *args, repeat=3, setup=None):
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def corners(cls, level):
+    return _lsystem_corners(cls.axiom, cls.rules, cls.angle, level, draw=cls.draw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'curve':>12} {'level':>5} {'steps':>9} {'corners (s)':>12} {'build (s)':>10}"
+    )
+
+    for cls, level in LEVELS:
+        steps = len(corners(cls, level)) - 1
+        turtle = best_time(corners, cls, level, repeat=args.repeat)
+        build = best_time(cls, level, repeat=args.repeat, setup=LSystem.cache.clear)
+        print(
+            f"{cls.__name__:>12} {level:>5} {steps:>9} {turtle:>12.4f} {build:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
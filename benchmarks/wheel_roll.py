@@ -0,0 +1,75 @@
+"""
+Mscene: Wheel Roll Benchmark
+
+Times Wheel.roll frames against the per-marker update loop it replaced.
+
+python benchmarks/wheel_roll.py --markers 1 10 50 200 --frames 240
+"""
+
+import argparse
+import time
+
+from manim import *
+from mscene.plugins import *
+
+
+def legacy_roll(wheel, direction, run_time=2):
+    wheel.point = wheel.dot.get_center()
+    wheel.circle.angle = 0
+    for marker in wheel.markers:
+        marker.theta = marker.angle
+    distance = np.linalg.norm(direction)
+    if any(direction > ORIGIN):
+        distance *= -1
+
+    def update_alpha(self, alpha):
+        angle = (alpha * distance) / self.radius
+        point1 = self.point + alpha * direction
+        self.circle.rotate(angle - self.circle.angle).move_to(point1)
+        self.circle.angle = angle
+        self.dot.move_to(point1)
+        for marker in self.markers:
+            point2_angle = angle + marker.theta
+            marker.angle = point2_angle
+            point2 = point1 + (
+                np.cos(point2_angle) * marker.distance,
+                np.sin(point2_angle) * marker.distance,
+                0.0,
+            )
+            if marker.line:
+                marker.line.set_points_by_ends(point1, point2)
+            marker.dot.move_to(point2)
+
+    return UpdateFromAlphaFunc(wheel, update_alpha, run_time=run_time)
+
+
+def make_wheel(num_markers):
+    markers = [(0.2 + 0.8 * i / num_markers, i, RED) for i in range(num_markers)]
+    return Wheel(radius=1.5, markers=markers)
+
+
+def frame_time(roll, num_markers, frames):
+    anim = roll(make_wheel(num_markers), RIGHT * 4)
+    anim.begin()
+    start = time.perf_counter()
+    for alpha in np.linspace(0, 1, frames):
+        anim.interpolate(alpha)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--markers", nargs="+", type=int, default=(1, 10, 50, 200))
+    parser.add_argument("--frames", type=int, default=240)
+    args = parser.parse_args()
+
+    print(f"{'markers':>7} {'legacy (ms)':>12} {'numpy (ms)':>11} {'speedup':>8}")
+
+    for num_markers in args.markers:
+        old = frame_time(legacy_roll, num_markers, args.frames) * 1000
+        new = frame_time(Wheel.roll, num_markers, args.frames) * 1000
+        print(f"{num_markers:>7} {old:>12.3f} {new:>11.3f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,28 @@
+import dis
+import hashlib
+import inspect
+import mimetypes
+import shutil
+import sys
+import time
+from importlib.metadata import version
+from pathlib import Path
+from types import CodeType
+
 from manim import *
+
+try:
+    from IPython import get_ipython
+    from IPython.core.magic import line_cell_magic, magics_class, needs_local_scope
+    from IPython.display import Image, Video, display
+    from manim.utils.ipython_magic import ManimMagic
+
+except ImportError:
+    _ipy = None
+
+else:
+    _ipy = get_ipython()
+
 config.disable_caching = True
 config.verbosity = "WARNING"
 config.media_width = "50%"
@@ -6,9 +30,214 @@ config.media_embed = True
 
 Text.set_default(font="STIX Two Text")
 
+CELL_CACHE_MAXBYTES = 2**30
+CELL_CACHE_MAXAGE = 7 * 24 * 60 * 60
+
+_QUALITY_KEYS = (
+    "pixel_width",
+    "pixel_height",
+    "frame_rate",
+    "frame_width",
+    "frame_height",
+    "background_color",
+    "background_opacity",
+    "transparent",
+    "format",
+    "renderer",
+)
+
+
+def _release_versions():
+    """Returns the RELEASE files and sources of the loaded mscene modules."""
+    paths = set()
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if name.split(".")[0] == "mscene" and file:
+            paths.add(Path(file))
+            paths.add(Path(file).with_name("RELEASE"))
+    return [(str(path), path.read_bytes()) for path in sorted(paths) if path.is_file()]
+
+
+def _code_names(code):
+    """Returns the names a code object and the functions and classes in it look up."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _code_key(code):
+    """Returns the bytecode, names and constants of a code object, without the file
+    name and line numbers that change each time a cell runs."""
+    consts = tuple(
+        _code_key(const) if isinstance(const, CodeType) else repr(const)
+        for const in code.co_consts
+    )
+    return code.co_code, code.co_names, consts
+
+
+def _value_key(value):
+    """Returns the contents of an array, the arrays of a mobject family, or the repr
+    of any other value."""
+    if isinstance(value, np.ndarray):
+        return value.shape, value.dtype.str, hashlib.sha256(value.tobytes()).digest()
+    if isinstance(value, Mobject):
+        return [
+            (
+                type(mob).__name__,
+                sorted(
+                    (name, _value_key(array))
+                    for name, array in vars(mob).items()
+                    if isinstance(array, np.ndarray)
+                ),
+            )
+            for mob in value.get_family()
+        ]
+    return repr(value)
+
+
+def _globals_key(cell, namespace):
+    """Returns the notebook globals a cell refers to and does not define itself,
+    following the functions and classes defined in other cells."""
+    code = compile(cell, "<cell>", "exec")
+    defined = {
+        ins.argval
+        for ins in dis.get_instructions(code)
+        if ins.opname in ("STORE_NAME", "STORE_GLOBAL")
+    }
+    names, seen, key = sorted(_code_names(code) - defined), set(), []
+    while names:
+        name = names.pop()
+        if name in seen or name not in namespace:
+            continue
+        seen.add(name)
+        value = namespace[name]
+        if value is config:
+            # the settings that change the output are part of the digest already
+            continue
+        if inspect.ismodule(value):
+            key.append((name, value.__name__))
+        elif getattr(value, "__module__", None) != "__main__" and (
+            inspect.isfunction(value) or inspect.isclass(value)
+        ):
+            key.append((name, value.__module__, value.__qualname__))
+        elif inspect.isfunction(value):
+            key.append((name, _code_key(value.__code__)))
+            names.extend(_code_names(value.__code__))
+        elif inspect.isclass(value):
+            members = []
+            for attr, member in vars(value).items():
+                if inspect.isfunction(member):
+                    members.append((attr, _code_key(member.__code__)))
+                    names.extend(_code_names(member.__code__))
+                elif not attr.startswith("__"):
+                    members.append((attr, _value_key(member)))
+            names.extend(base.__name__ for base in value.__bases__)
+            key.append((name, [base.__name__ for base in value.__bases__], members))
+        else:
+            key.append((name, _value_key(value)))
+    return key
+
+
+def _cell_digest(line, cell, namespace):
+    """Returns a hash of a %%manim cell, its arguments, the notebook globals it uses,
+    the mscene releases and the quality settings."""
+    key = (
+        version("manim"),
+        line.split(),
+        cell,
+        _globals_key(cell, namespace),
+        _release_versions(),
+        [(k, str(config[k])) for k in _QUALITY_KEYS],
+    )
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def _evict_cells(directory):
+    """Removes cached cells older than CELL_CACHE_MAXAGE seconds, then the least
+    recently used ones above CELL_CACHE_MAXBYTES."""
+    files = sorted(
+        ((path, path.stat()) for path in directory.iterdir() if path.is_file()),
+        key=lambda item: item[1].st_mtime,
+    )
+    nbytes = sum(stat.st_size for _, stat in files)
+    now = time.time()
+    for path, stat in files:
+        if nbytes <= CELL_CACHE_MAXBYTES and now - stat.st_mtime <= CELL_CACHE_MAXAGE:
+            continue
+        path.unlink(missing_ok=True)
+        nbytes -= stat.st_size
+
+
+if _ipy is not None:
+
+    @magics_class
+    class CachedManimMagic(ManimMagic):
+        """The %%manim magic with a cache of rendered cells.
+
+        An unchanged cell with the same arguments, mscene releases and quality settings
+        shows its stored video without rendering. The functions, classes and values
+        from other cells that the cell uses are part of the key, with objects other
+        than arrays and mobjects compared by repr. --disable_caching renders without
+        this cache or manim's own one, which otherwise reuses the partial movie files
+        of unchanged animations.
+        """
+
+        @needs_local_scope
+        @line_cell_magic
+        def manim(self, line, cell=None, local_ns=None):
+            args = line.split()
+            if (
+                not cell
+                or not args
+                or {"-h", "--help", "--version", "--disable_caching"} & set(args)
+            ):
+                return super().manim(line, cell, local_ns)
+
+            directory = Path(config.media_dir) / "cells"
+            digest = _cell_digest(line, cell, local_ns)
+            cached = list(directory.glob(f"{digest}.*"))
+
+            if cached:
+                exec(cell, local_ns)
+                path = cached[0]
+                path.touch()
+                _show_cell(path)
+                return
+
+            rendered = dict(self.rendered_files)
+            with tempconfig({"disable_caching": False}):
+                super().manim(line, cell, local_ns)
+            new = [v for k, v in self.rendered_files.items() if rendered.get(k) != v]
+
+            if new and new[0].is_file():
+                directory.mkdir(parents=True, exist_ok=True)
+                tmp = directory / f".{digest}.tmp"
+                shutil.copy(new[0], tmp)
+                tmp.replace(directory / f"{digest}{new[0].suffix}")
+                _evict_cells(directory)
+
+    def _show_cell(path):
+        """Displays a cached cell as %%manim does."""
+        if mimetypes.guess_type(path)[0].startswith("image"):
+            display(Image(filename=path))
+        else:
+            embed = config.media_embed or "google.colab" in str(_ipy)
+            display(
+                Video(
+                    path,
+                    html_attributes=f'controls autoplay loop style="max-width: {config.media_width};"',
+                    embed=embed,
+                )
+            )
+
+    _ipy.register_magics(CachedManimMagic)
+
+
 class ManimScene(Scene):
     def construct(self):
         banner = ManimBanner()
         self.play(banner.create())
         self.play(banner.expand())
-        self.wait(1.5)
\ No newline at end of file
+        self.wait(1.5)
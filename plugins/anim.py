@@ -1,13 +1,159 @@
 from manim import *
 
 
+def _bezier_pieces(curves, t0, t1):
+    """Returns the pieces of cubic Bezier curves between parameters t0 and t1."""
+    t0, t1 = t0[..., None, None], t1[..., None, None]
+
+    def blossom(*params):
+        p = curves
+        for u in params:
+            p = (1 - u) * p[..., :-1, :] + u * p[..., 1:, :]
+        return p
+
+    pieces = [blossom(t0, t0, t0), blossom(t0, t0, t1), blossom(t0, t1, t1)]
+    pieces.append(blossom(t1, t1, t1))
+    return np.concatenate(pieces, axis=-2)
+
+
+def _dash_bounds(slot, num, ratio, closed, offset):
+    """Gets the start and end proportions of dash slots, as in DashedVMobject."""
+
+    dash_len = ratio / num
+    void_len = (1 - ratio) / np.where(closed, num, np.maximum(num - 1, 1))
+    pattern_len = np.where(closed, 1, 1 + void_len)
+    period = dash_len + void_len
+
+    # open curves have an extra slot for the last dash when it wraps to the start
+    extra = slot == num
+    phase = np.minimum(slot, num - 1) * period + offset * period
+    starts = phase % pattern_len
+    ends = (phase + dash_len) % pattern_len
+
+    last = (slot >= num - 1) & ~closed
+    out = last & (ends > 1) & (starts > 1)
+    wrap = last & ~out & (ends < dash_len)
+    split = wrap & (starts < 1)
+    clip = last & ~out & ~wrap & (starts > 1 - dash_len)
+
+    active = np.where(extra, split, ~out)
+    starts = np.where(extra & split | ~extra & wrap & ~split, 0, starts)
+    ends = np.where(~extra & (split | clip), 1, ends)
+
+    return starts, ends, active
+
+
+class _DashBatch:
+    """Dash templates of DashFlows concatenated for one array pass per frame."""
+
+    def __init__(self, flows):
+        sizes = [len(flow._dashes) for flow in flows]
+        self.owner = owner = np.repeat(np.arange(len(flows)), sizes)
+        self.slot = np.concatenate([np.arange(size) for size in sizes])
+        self.num = np.array([flow.num_dashes for flow in flows])[owner]
+        self.ratio = np.array([flow.dashed_ratio for flow in flows])[owner]
+        self.closed = np.array([flow._closed for flow in flows])[owner]
+        self.equal = np.array([flow.equal_lengths for flow in flows])[owner]
+
+        num_curves = np.array([len(flow._curves) for flow in flows])
+        self.num_curves = num_curves[owner]
+        self.first_curve = (np.cumsum(num_curves) - num_curves)[owner]
+        self.curves = np.concatenate([flow._curves for flow in flows])
+
+        # arc length tables are shifted apart to search them all at once, and each
+        # lookup is kept inside the table of its own flow
+        totals = np.array([flow._lengths[-1] for flow in flows])
+        bases = np.cumsum(totals + 1) - totals - 1
+        sizes = np.array([flow._lengths.size for flow in flows])
+        self.total, self.base = totals[owner], bases[owner]
+        self.first_entry = (np.cumsum(sizes) - sizes)[owner]
+        self.last_entry = self.first_entry + sizes[owner] - 2
+        self.lengths = np.concatenate([f._lengths + b for f, b in zip(flows, bases)])
+        self.alphas = np.concatenate([flow._alphas for flow in flows])
+        self.num_pieces = max(flow._num_pieces for flow in flows)
+
+    def _curve_alphas(self, proportions):
+        """Maps arc length proportions of the dashes to curve proportions."""
+
+        lengths = np.clip(proportions, 0, 1) * self.total + self.base
+        entry = np.searchsorted(self.lengths, lengths, side="right") - 1
+        entry = np.clip(entry, self.first_entry, self.last_entry)
+
+        l0, l1 = self.lengths[entry], self.lengths[entry + 1]
+        a0, a1 = self.alphas[entry], self.alphas[entry + 1]
+        span = np.where(l1 > l0, l1 - l0, 1)
+        t = np.clip((lengths - l0) / span, 0, 1)
+        return a0 + t * (a1 - a0)
+
+    def points(self, offsets, out):
+        """Writes the dashes at the offsets to out and returns which are active."""
+
+        starts, ends, active = _dash_bounds(
+            self.slot, self.num, self.ratio, self.closed, offsets[self.owner]
+        )
+        if self.equal.any():
+            starts = np.where(self.equal, self._curve_alphas(starts), starts)
+            ends = np.where(self.equal, self._curve_alphas(ends), ends)
+
+        num_curves = self.num_curves
+        lower = starts * num_curves
+        upper = ends * num_curves
+        upper = np.where(self.closed & (upper < lower), upper + num_curves, upper)
+
+        first = np.minimum(np.floor(lower), num_curves - 1)
+        last = np.maximum(np.ceil(upper) - 1, first)[:, None]
+        index = first[:, None] + np.arange(self.num_pieces)
+        pad = index > last
+        index = np.minimum(index, last)
+        t1 = np.clip(upper[:, None] - index, 0, 1)
+        t0 = np.where(pad, t1, np.clip(lower[:, None] - index, 0, 1))
+        index = self.first_curve[:, None] + index.astype(int) % num_curves[:, None]
+
+        pieces = _bezier_pieces(self.curves[index], t0, t1)
+        out[:] = pieces.reshape(len(self.slot), -1, 3)
+        return active
+
+
+def _rates(rate_func, alphas):
+    """Applies a rate function to alphas, calling it only for those in (0, 1)."""
+    values = np.where(alphas < 1, rate_func(0.0), rate_func(1.0))
+    running = np.flatnonzero((alphas > 0) & (alphas < 1))
+    values[running] = [rate_func(a) for a in alphas[running]]
+    return values
+
+
+def _stroke_key(vmob):
+    return (
+        vmob.get_stroke_rgbas().tobytes(),
+        vmob.get_stroke_width(),
+        vmob.get_stroke_rgbas(background=True).tobytes(),
+        vmob.get_stroke_width(background=True),
+    )
+
+
+def _dash_flow_updater(mob, dt):
+    mob.offset = (mob.rate * dt + mob.offset) % 1
+    mob.update_dashes()
+
+
+def _dash_flow_group_updater(mob, dt):
+    mob.update_dashes(dt)
+
+
 class DashFlow(DashedVMobject):
     """
     A dashed VMobject that continuously updates its dash offset for a dash shifting effect.
 
+    The arc length table and dash slots are built once, and each frame moves the
+    points of the existing dashes in place.
+
     Args:
         vmob (VMobject): The VMobject to be dashed and animated.
         rate (float, optional): The rate at which dash offset shifts over time. Defaults to 1.
+        phases (bool | int, optional): If True, rounds the offset to the number of frames
+            in one period at the frame rate, or to the given number of phases, and
+            caches the dashes of each phase. Defaults to None.
+        max_bytes (int, optional): The memory cap of the phase cache. Defaults to 2**24.
         **kwargs: Additional keyword arguments passed to DashedVMobject.
 
     Methods:
@@ -17,17 +163,114 @@ class DashFlow(DashedVMobject):
             Resume the dash animation.
         clear():
             Remove all updaters.
+        update_dashes():
+            Moves the dashes to the current offset.
+        warm():
+            Caches the dashes of every phase before playing.
     """
 
-    def __init__(self, vmob, rate=1, **kwargs):
+    def __init__(self, vmob, rate=1, phases=None, max_bytes=2**24, **kwargs):
         super().__init__(vmob, **kwargs)
-        self.offset = 0
+        self.vmob = vmob
+        self.rate = rate
+        self.phases = phases
+        self.max_bytes = max_bytes
+        self.offset = kwargs.get("dash_offset", 0) % 1
+        self.equal_lengths = kwargs.get("equal_lengths", True)
+        self.flow_group = None
+
+        num_tips = len(vmob.copy().pop_tips()) if hasattr(vmob, "pop_tips") else 0
+        num_dashes = len(self.submobjects) - num_tips
+        self._dashes = self.submobjects[:num_dashes]
+        self._tips = self.submobjects[num_dashes:]
+
+        if num_dashes:
+            self._dash_template()
+            self.update_dashes()
+            self.add_updater(_dash_flow_updater)
+
+    def _dash_template(self):
+        """Builds the arc length table and the point buffer of the dashes."""
+
+        vmob = self.vmob.copy()
+        if hasattr(vmob, "pop_tips"):
+            vmob.pop_tips()
+        self._source = self.vmob.points.copy()
+        self._curves = vmob.points.reshape(-1, 4, 3)
+        self._closed = vmob.is_closed()
+
+        t = np.linspace(0, 1, 10)[:, None]
+        weights = np.hstack(
+            [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3]
+        )
+        samples = weights @ self._curves
+        norms = np.linalg.norm(np.diff(samples, axis=1), axis=2)
+        self._lengths = np.cumsum(np.append(0, norms))
+        self._alphas = np.linspace(0, 1, self._lengths.size)
+
+        n, r = self.num_dashes, self.dashed_ratio
+        num_curves = len(self._curves)
+        if self.equal_lengths:
+            bounds = self._lengths[::9] / self._lengths[-1]
+        else:
+            bounds = np.linspace(0, 1, num_curves + 1)
+        bounds = np.concatenate((bounds[:-1], bounds + 1))
+        reach = np.searchsorted(bounds, bounds[1 : num_curves + 1] + r / n)
+        self._num_pieces = int((reach - np.arange(num_curves)).max()) + 1
+
+        num_slots = n if self._closed else n + 1
+        while len(self._dashes) < num_slots:
+            self._dashes.append(self._dashes[-1].copy())
+        self.submobjects = [*self._dashes, *self._tips]
+        self._batch = _DashBatch([self])
+        self._buffer = np.zeros((num_slots, 4 * self._num_pieces, 3))
+        self._phase_cache = {}
+        self._phase_bytes = 0
+
+    def _num_phases(self):
+        if self.phases is True:
+            return max(round(config.frame_rate / abs(self.rate or 1)), 1)
+        return self.phases
+
+    def update_dashes(self):
+        """Moves the points of the dashes to the current offset."""
+
+        if not np.array_equal(self.vmob.points, self._source):
+            self._dash_template()
+
+        num_phases = self._num_phases()
+        if num_phases:
+            key = (num_phases, round(self.offset * num_phases) % num_phases)
+            if key in self._phase_cache:
+                active, points = self._phase_cache[key]
+                self._buffer[:] = points
+            else:
+                offset = np.array([key[1] / num_phases])
+                active = self._batch.points(offset, self._buffer)
+                if self._phase_bytes + self._buffer.nbytes <= self.max_bytes:
+                    self._phase_cache[key] = active, self._buffer.copy()
+                    self._phase_bytes += self._buffer.nbytes
+        else:
+            active = self._batch.points(np.array([self.offset]), self._buffer)
+
+        for dash, on, points in zip(self._dashes, active, self._buffer):
+            dash.points = points if on else points[:0]
 
-        def _updater(m, dt):
-            self.offset = (rate * dt + self.offset) % 1
-            m.become(DashedVMobject(vmob, dash_offset=self.offset, **kwargs))
+        return self
 
-        self.add_updater(_updater)
+    def warm(self):
+        """Caches the dashes of every phase up to the memory cap."""
+
+        num_phases = self._num_phases()
+        if num_phases:
+            offset = self.offset
+            for phase in range(num_phases):
+                self.offset = phase / num_phases
+                self.update_dashes()
+            self.offset = offset
+            self.update_dashes()
+
+        return self
 
     def pause(self):
         self.suspend_updating()
@@ -37,12 +280,112 @@ class DashFlow(DashedVMobject):
 
     def clear(self):
         self.clear_updaters()
+        if self.flow_group is not None:
+            self.flow_group._unregister(self)
+
+
+class DashFlowGroup(VGroup):
+    """
+    A group of DashFlows driven by one updater that advances their offsets together
+    and moves the dashes of all of them in one array pass.
+
+    DashFlows keep their own pause, resume and clear, and get their own updater
+    back when removed from the group.
+
+    Args:
+        *flows (DashFlow): The DashFlows to add.
+        **kwargs: Additional keyword arguments passed to VGroup.
+
+    Methods:
+        update_dashes(dt):
+            Advances the offsets by dt and moves the dashes.
+    """
+
+    def __init__(self, *flows, **kwargs):
+        self.flows = []
+        self._batch = None
+        super().__init__(*flows, **kwargs)
+        self.add_updater(_dash_flow_group_updater)
+
+    def add(self, *vmobjects):
+        super().add(*vmobjects)
+        for flow in vmobjects:
+            if isinstance(flow, DashFlow) and flow._dashes and flow not in self.flows:
+                if flow.flow_group is not None:
+                    flow.flow_group._unregister(flow)
+                flow.remove_updater(_dash_flow_updater)
+                flow.flow_group = self
+                self.flows.append(flow)
+                self._batch = None
+        return self
+
+    def remove(self, *vmobjects):
+        super().remove(*vmobjects)
+        for flow in vmobjects:
+            if flow in self.flows:
+                self._unregister(flow)
+                flow.add_updater(_dash_flow_updater)
+        return self
+
+    def _unregister(self, flow):
+        self.flows.remove(flow)
+        flow.flow_group = None
+        self._batch = None
+
+    def __deepcopy__(self, memo):
+        # copied dashes no longer share points with the copied buffer
+        result = super().__deepcopy__(memo)
+        result._batch = None
+        return result
+
+    def update_dashes(self, dt=0):
+        """Advances the offsets of running DashFlows by dt and moves all dashes."""
+
+        flows = []
+        for flow in self.flows:
+            if not flow.updating_suspended:
+                flow.offset = (flow.rate * dt + flow.offset) % 1
+            if not np.array_equal(flow.vmob.points, flow._source):
+                flow._dash_template()
+                self._batch = None
+            if flow.phases:
+                flow.update_dashes()
+            else:
+                flows.append(flow)
+
+        if not flows:
+            return self
+
+        if self._batch is None or self._batch_flows != flows:
+            self._batch = _DashBatch(flows)
+            self._batch_flows = flows
+            self._dashes = [dash for flow in flows for dash in flow._dashes]
+            size = 4 * self._batch.num_pieces
+            self._buffer = np.zeros((len(self._dashes), size, 3))
+            self._active = np.zeros(len(self._dashes), dtype=bool)
+            changed = range(len(self._dashes))
+        else:
+            changed = None
+
+        offsets = np.array([flow.offset for flow in flows])
+        active = self._batch.points(offsets, self._buffer)
+        if changed is None:
+            changed = np.flatnonzero(active != self._active)
+        for i in changed:
+            points = self._buffer[i]
+            self._dashes[i].points = points if active[i] else points[:0]
+        self._active = active
+
+        return self
 
 
-class FlashFade(AnimationGroup):
+class FlashFade(Animation):
     """
     Animation for VMobject to fade in or out with flashing outline effect.
 
+    Submobjects start one after another with a lag, as in an AnimationGroup, while
+    their opacity and flash window are set for all of them at once with arrays.
+
     Args:
         vmob: The VMobject to animate.
         mode: IN for fade-in, OUT for fade-out, None for fade-in then fade-out. Defaults to None.
@@ -52,7 +395,7 @@ class FlashFade(AnimationGroup):
         time_width: The relative duration of the flash effect. Defaults to 0.5.
         run_time: The duration of each sub-animation. Defaults to 1.0.
         lag_ratio: The lag ratio between sub-animations. Defaults to 0.125.
-        **kwargs: Additional keyword arguments for AnimationGroup.
+        **kwargs: Additional keyword arguments for Animation.
     """
 
     def __init__(
@@ -67,45 +410,154 @@ class FlashFade(AnimationGroup):
         lag_ratio=0.125,
         **kwargs,
     ):
+        self.mode = mode
+        self.time_width = time_width
+        self.part_run_time = run_time
+        self.part_lag_ratio = lag_ratio
+
+        if mode is not IN and mode is not OUT:
+            vmob = vmob.copy()
+        self._parts = vmob.split()
         if reverse:
-            vmob = vmob[::-1]
-            vcopy = vmob.copy()
-            vcopy.set_fill(opacity=0).set_stroke(color=color, width=width)
-            for vm in vcopy:
-                vm = vm.reverse_direction()
-        else:
-            vcopy = vmob.copy()
-            vcopy.set_fill(opacity=0).set_stroke(color=color, width=width)
-
-        n = len(vmob)
-        anim = []
-
-        if mode is IN:
-            for i in range(n):
-                anim.append(
-                    AnimationGroup(
-                        FadeIn(vmob[i]),
-                        ShowPassingFlash(vcopy[i], time_width=time_width),
-                        run_time=run_time,
-                    )
-                )
-        elif mode is OUT:
-            for i in range(n):
-                anim.append(
-                    AnimationGroup(
-                        FadeOut(vmob[i]),
-                        ShowPassingFlash(vcopy[i], time_width=time_width),
-                        run_time=run_time,
-                    )
-                )
+            self._parts.reverse()
+        self._flash_template(color, width, reverse)
+
+        num_parts = max(len(self._parts), 1)
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(
+            vmob,
+            run_time=((num_parts - 1) * lag_ratio + 1) * run_time,
+            remover=mode is not IN,
+            introducer=mode is not OUT,
+            **kwargs,
+        )
+
+    def _family_owners(self, parts):
+        """Maps each family member to the last part that contains it."""
+        owners = {}
+        for i, part in enumerate(parts):
+            for mob in part.get_family():
+                owners[mob] = i
+        return owners
+
+    def begin(self):
+        # opacities of all parts live in one array, shared with the parts as views
+        styles, owners = [], []
+        self._originals = []
+        for mob, i in self._family_owners(self._parts).items():
+            if not mob.has_points():
+                continue
+            for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+                rgbas = getattr(mob, attr, None)
+                if isinstance(rgbas, np.ndarray) and len(rgbas):
+                    self._originals.append((mob, attr, rgbas))
+                    styles.append(rgbas)
+                    owners.append(np.full(len(rgbas), i))
+
+        self._rgbas = np.concatenate(styles) if styles else np.zeros((0, 4))
+        self._opacities = self._rgbas[:, 3].copy()
+        self._style_owner = np.concatenate(owners) if owners else np.zeros(0, int)
+        start = 0
+        for mob, attr, rgbas in self._originals:
+            setattr(mob, attr, self._rgbas[start : start + len(rgbas)])
+            start += len(rgbas)
+
+        self._alphas = np.full(max(len(self._parts), 1), np.nan)
+        super().begin()
+
+    def _flash_template(self, color, width, reverse):
+        """Builds one flash outline per stroke style over the curves of all parts."""
+
+        groups = {}
+        for mob, i in self._family_owners(self._parts).items():
+            if mob.get_num_curves():
+                groups.setdefault(_stroke_key(mob), []).append((mob, i))
+
+        runs = {}
+        for group in groups.values():
+            vmob = VMobject().match_style(group[0][0]).set_fill(opacity=0)
+            vmob.set_stroke(color=color, width=width)
+            runs.setdefault(_stroke_key(vmob), (vmob, []))[1].extend(group)
+
+        self.flash = VGroup()
+        curves, owners = [], []
+        parts = set(self._parts)
+        for vmob, run in runs.values():
+            self.flash.add(vmob)
+            for mob, i in run:
+                points = mob.points[::-1] if reverse and mob in parts else mob.points
+                curves.append(points.reshape(-1, 4, 3))
+                owners.append(i)
+
+        # flash windows of all outlines are cut from one array of source curves
+        num_curves = np.array([len(c) for c in curves], dtype=int)
+        num_pieces = np.ceil(min(self.time_width, 1) * num_curves).astype(int) + 2
+        piece_owner = np.repeat(np.arange(len(curves)), num_pieces)
+        piece_start = np.cumsum(num_pieces) - num_pieces
+
+        self._curves = np.concatenate(curves) if curves else np.zeros((0, 4, 3))
+        self._flash_owner = np.array(owners, dtype=int)
+        self._num_curves = num_curves
+        self._first_curve = np.cumsum(num_curves) - num_curves
+        self._piece_owner = piece_owner
+        self._piece_index = np.arange(len(piece_owner)) - piece_start[piece_owner]
+        self._pieces = np.zeros((len(piece_owner) * 4, 3))
+
+        bounds = 4 * np.append(0, np.cumsum(num_pieces))
+        i = 0
+        for vmob, run in runs.values():
+            vmob.points = self._pieces[bounds[i] : bounds[i + len(run)]]
+            i += len(run)
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def _setup_scene(self, scene):
+        # the flash is drawn above the parts, as ShowPassingFlash introduces it
+        super()._setup_scene(scene)
+        if scene is not None:
+            scene.add(self.flash)
+
+    def interpolate_mobject(self, alpha):
+        num_parts = max(len(self._parts), 1)
+        time = self.rate_func(alpha) * ((num_parts - 1) * self.part_lag_ratio + 1)
+        starts = np.arange(num_parts) * self.part_lag_ratio
+        alphas = np.clip(time - starts, 0, 1)
+
+        flash = _rates(smooth, alphas)
+        if self.mode is IN:
+            opacity = flash
+        elif self.mode is OUT:
+            opacity = 1 - flash
         else:
-            for i in range(n):
-                anim.append(
-                    AnimationGroup(
-                        FadeIn(vmob[i].copy(), rate_func=there_and_back_with_pause),
-                        ShowPassingFlash(vcopy[i], time_width=time_width),
-                        run_time=run_time,
-                    )
-                )
-
-        super().__init__(*anim, lag_ratio=lag_ratio, **kwargs)
+            opacity = _rates(there_and_back_with_pause, alphas)
+        self._rgbas[:, 3] = self._opacities * opacity[self._style_owner]
+
+        # only parts whose alpha changed since the last frame get new windows
+        changed = alphas != self._alphas
+        self._alphas = alphas
+        pieces = np.flatnonzero(changed[self._flash_owner][self._piece_owner])
+        if not len(pieces):
+            return
+
+        tw = self.time_width
+        upper = flash[self._flash_owner] * (1 + tw)
+        lower = np.clip(upper - tw, 0, 1) * self._num_curves
+        upper = np.clip(upper, 0, 1) * self._num_curves
+
+        owner = self._piece_owner[pieces]
+        first = np.minimum(np.floor(lower), self._num_curves - 1)
+        last = np.maximum(np.ceil(upper) - 1, first)[owner]
+        index = first[owner] + self._piece_index[pieces]
+        pad = index > last
+        index = np.minimum(index, last)
+        t1 = np.clip(upper[owner] - index, 0, 1)
+        t0 = np.where(pad, t1, np.clip(lower[owner] - index, 0, 1))
+        curves = self._curves[self._first_curve[owner] + index.astype(int)]
+        self._pieces.reshape(-1, 4, 3)[pieces] = _bezier_pieces(curves, t0, t1)
+
+    def clean_up_from_scene(self, scene):
+        scene.remove(self.flash)
+        super().clean_up_from_scene(scene)
+        for mob, attr, rgbas in self._originals:
+            setattr(mob, attr, rgbas)
@@ -1,39 +1,803 @@
+import os
+from collections import OrderedDict
+
 from manim import *
 
+__all__ = [
+    "LSystem",
+    "KochCurve",
+    "KochSnowflake",
+    "SierpinskiArrowhead",
+    "DragonCurve",
+    "LevyCurve",
+    "HilbertCurve",
+]
+
+
+class _LevelCache:
+    """Least recently used cache of normalized point arrays with a memory cap in bytes."""
+
+    def __init__(self, maxbytes=2**27):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._arrays = OrderedDict()
+
+    def get(self, key, func):
+        """Gets the array for key, calling func to build it on a miss."""
+
+        if key in self._arrays:
+            self.hits += 1
+            self._arrays.move_to_end(key)
+            return self._arrays[key]
+
+        self.misses += 1
+        array = func()
+        array.flags.writeable = False
+
+        if array.nbytes <= self.maxbytes:
+            self._arrays[key] = array
+            self.nbytes += array.nbytes
+            self.resize(self.maxbytes)
+
+        return array
+
+    def resize(self, maxbytes):
+        """Sets the memory cap and evicts least recently used arrays above it."""
+
+        self.maxbytes = maxbytes
+        while self.nbytes > self.maxbytes:
+            _, array = self._arrays.popitem(last=False)
+            self.nbytes -= array.nbytes
+
+    def clear(self):
+        """Removes all arrays and resets the statistics."""
+
+        self._arrays.clear()
+        self.nbytes = self.hits = self.misses = 0
+
+    def info(self):
+        """Returns hit and miss counts and memory usage."""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._arrays),
+            "nbytes": self.nbytes,
+            "maxbytes": self.maxbytes,
+        }
+
+
+def _expand_turns(axiom, rules, level, draw="F"):
+    """Applies the rules level times to the axiom, returning the turn count of each step.
+
+    Only the symbols that are rewritten or draw are expanded, and every other symbol
+    is folded into the turn counts, as the net turn of its expansion, so each pass
+    touches a fraction of the symbols and no pass runs over the full level.
+    """
+
+    symbols = sorted(set(axiom + "".join(rules.values())) | set(rules) | set(draw))
+    codes = {a: i for i, a in enumerate(symbols)}
+    growth = np.array(
+        [[rules.get(a, a).count(b) for b in symbols] for a in symbols], dtype=np.int64
+    )
+
+    # the net turns of every symbol after each number of rewrites
+    nets = [np.array([(a == "+") - (a == "-") for a in symbols], dtype=np.int64)]
+    for _ in range(level):
+        nets.append(growth @ nets[-1])
+
+    def expand(text, depth):
+        """Gets the codes and turn counts of the symbols of text that are kept."""
+        keep = set(draw) if depth == 0 else set(draw) | set(rules)
+        kept = [(codes[a], i) for i, a in enumerate(text) if a in keep]
+        turns = np.cumsum([0] + [nets[depth][codes[a]] for a in text])
+        return [c for c, _ in kept], [turns[i] for _, i in kept]
+
+    kept, turns = expand(axiom, level)
+    kept, turns = np.array(kept, dtype=np.int64), np.array(turns, dtype=np.int64)
+    for depth in reversed(range(level)):
+        pieces = [expand(rules.get(a, a), depth) for a in symbols]
+        sizes = np.array([len(c) for c, _ in pieces], dtype=np.int64)
+        width = max(1, sizes.max())
+        table = np.zeros((len(symbols), width), dtype=np.int64)
+        offsets = np.zeros((len(symbols), width), dtype=np.int64)
+        for i, (c, t) in enumerate(pieces):
+            table[i, : len(c)], offsets[i, : len(t)] = c, t
+
+        sizes = sizes[kept]
+        owner = np.repeat(np.arange(len(kept)), sizes)
+        index = np.arange(len(owner)) - (np.cumsum(sizes) - sizes)[owner]
+        parents = kept[owner]
+        kept = table[parents, index]
+        turns = turns[owner] + offsets[parents, index]
+    return turns
+
+
+def _lsystem_corners(axiom, rules, angle, level, heading=0, draw="F"):
+    """Returns the turtle corners of an L-system level as complex numbers."""
+
+    turns = _expand_turns(axiom, rules, level, draw)
+
+    num_turns = TAU / angle
+    if np.isclose(num_turns, round(num_turns)):
+        directions = np.exp(1j * (heading + angle * np.arange(round(num_turns))))
+        steps = directions[turns % round(num_turns)]
+    else:
+        steps = np.exp(1j * (heading + angle * turns))
+
+    return np.concatenate(([0], np.cumsum(steps)))
+
+
+def _complex_to_points(z):
+    return np.stack((z.real, z.imag, np.zeros(z.size)), axis=1)
+
+
+def _corners_to_points(corners):
+    """Returns the cubic Bezier points of straight segments between corners."""
+    starts = corners[:-1]
+    steps = (corners[1:] - starts) / 3
+    points = np.empty((len(steps), 4, 3))
+    points[:, 0] = starts
+    points[:, 1] = starts + steps
+    points[:, 2] = starts + 2 * steps
+    points[:, 3] = corners[1:]
+    return points.reshape(-1, 3)
+
+
+def _split_curves(points, t):
+    """Splits every cubic Bezier curve of points at the parameters t.
+
+    The parameters are one sorted sequence from 0 to 1, or one row per curve.
+    """
+    curves = points.reshape(-1, 1, 4, 3)
+    t = np.broadcast_to(t, (len(curves), np.shape(t)[-1]))
+    t0, t1 = t[:, :-1, None, None], t[:, 1:, None, None]
+
+    def blossom(*params):
+        p = curves
+        for u in params:
+            p = (1 - u) * p[..., :-1, :] + u * p[..., 1:, :]
+        return p
+
+    pieces = [blossom(t0, t0, t0), blossom(t0, t0, t1), blossom(t0, t1, t1)]
+    pieces.append(blossom(t1, t1, t1))
+    return np.concatenate(pieces, axis=2).reshape(-1, 3)
+
+
+def _chord_params(points, k):
+    """Projects the corners of every k curves onto the chord from first to last.
+
+    Splitting a lower level curve at these parameters keeps the pieces of it that a
+    higher level leaves in place, such as the outer thirds of a Koch curve step.
+    """
+    corners = points.reshape(-1, k, 4, 3)[:, :, 0, :2]
+    ends = points.reshape(-1, k * 4, 3)[:, -1, :2]
+    chords = ends - corners[:, 0]
+    offsets = corners - corners[:, :1]
+    norms = np.einsum("ij,ij->i", chords, chords)
+    safe = np.where(norms > 0, norms, 1)
+    t = np.einsum("ikj,ij->ik", offsets, chords) / safe[:, None]
+    t[norms <= 0] = np.arange(k) / k
+    t = np.sort(np.clip(t, 0, 1), axis=1)
+    return np.concatenate((t, np.ones((len(t), 1))), axis=1)
+
+
+def _affine_fit(p, q):
+    """Fits the 2D affine map x -> matrix @ x + shift that takes points p to q.
+
+    It is solved from the first point, the point farthest from it and the point
+    farthest off the line between them, or as a similarity if all are collinear.
+    """
+    d, e = p[:, :2] - p[0, :2], q[:, :2] - q[0, :2]
+    i = np.argmax(np.einsum("ij,ij->i", d, d))
+    cross = np.abs(d[i, 0] * d[:, 1] - d[i, 1] * d[:, 0])
+    j = np.argmax(cross)
+
+    src, dst = np.array([d[i], d[j]]), np.array([e[i], e[j]])
+    if cross[j] <= 1e-9 * (d[i] @ d[i]):
+        src[1] = -d[i, 1], d[i, 0]
+        dst[1] = -e[i, 1], e[i, 0]
+
+    matrix = np.linalg.solve(src, dst).T
+    shift = q[0, :2] - matrix @ p[0, :2]
+    return matrix, shift
+
+
+def _lod_updater(vmob):
+    vmob.update_lod()
+
+
+def _spread(values, n):
+    """Stretches a sequence of values over n items, or repeats a single value."""
+    values = np.asarray(values)
+    if values.ndim == 0 or len(values) == n:
+        return values
+    return values[np.arange(n) * len(values) // n]
+
+
+class _Segments(VGroup):
+    """Steps of a compact LSystem, indexed like the submobjects of group=False.
+
+    The runs that draw the steps are split off as the submobjects, so a view can be
+    styled and animated like a submobject of group=False. Single steps have no items.
+    Copies, such as animation targets, hold copies of the runs and no curve, so they
+    are styled like any VGroup.
+    """
+
+    vmob = None
+
+    def __init__(self, vmob, indices, nesting=0):
+        super().__init__(*vmob._runs_of(indices))
+        self.vmob = vmob
+        self.indices = indices
+        self.nesting = nesting
+
+    def __deepcopy__(self, memo):
+        vmob, self.vmob = self.vmob, None
+        try:
+            return super().__deepcopy__(memo)
+        finally:
+            self.vmob = vmob
+
+    def _children(self):
+        sizes = self.vmob._segment_sizes
+        if self.nesting < len(sizes):
+            return self.indices.reshape(-1, sizes[self.nesting])
+        return self.indices[:0, None]
+
+    def __len__(self):
+        if self.vmob is None:
+            return super().__len__()
+        return len(self._children())
+
+    def __iter__(self):
+        if self.vmob is None:
+            return super().__iter__()
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, value):
+        if self.vmob is None:
+            return super().__getitem__(value)
+        children = self._children()
+        if isinstance(value, (int, np.integer)):
+            return _Segments(self.vmob, children[value], self.nesting + 1)
+        return _Segments(self.vmob, children[value].ravel(), self.nesting)
+
+    def set_stroke(
+        self, color=None, width=None, opacity=None, background=False, family=True
+    ):
+        # the default stroke is set in __init__ before the view has its steps
+        if background or self.vmob is None:
+            return super().set_stroke(color, width, opacity, background, family)
+        self.vmob._set_segment_stroke(self.indices, color, width, opacity)
+        self.submobjects = []
+        return self.add(*self.vmob._runs_of(self.indices))
+
+    def set_color(self, color, family=True):
+        if self.vmob is None:
+            return super().set_color(color, family)
+        return self.set_stroke(color=color)
+
+    def get_stroke_color(self, background=False):
+        if background or self.vmob is None:
+            return super().get_stroke_color(background)
+        return ManimColor.from_rgb(self.vmob.segment_rgbas[self.indices[0], :3])
+
+    def get_stroke_width(self, background=False):
+        if background or self.vmob is None:
+            return super().get_stroke_width(background)
+        return self.vmob.segment_widths[self.indices[0]]
+
+    get_color = get_stroke_color
+
+
+class LSystem(VMobject):
+    """
+    A VMobject drawn by a turtle that follows the symbols of an L-system level.
+
+    Symbols in draw move the turtle one step forward, + and - turn it by angle,
+    and all other symbols are ignored. Branching symbols are not supported.
+    Build time grows linearly with the number of steps at the level, so levels of
+    a million steps take about half a second, mostly to lay out their points.
+
+    Args:
+        level (int, optional): The number of times the rules are applied. Defaults to 0.
+        length (float, optional): The length of a level 0 step. Defaults to 3/4 of frame height.
+        point (Point3D, optional): The center of the curve. Defaults to ORIGIN.
+        axiom (str, optional): The level 0 symbols.
+        rules (dict, optional): The symbols that replace each symbol at the next level.
+        angle (float, optional): The turning angle.
+        heading (float, optional): The direction from start to end of an open curve,
+            or of the first step of a closed one. Defaults to 0.
+        ratio (float, optional): The step length ratio between levels. Defaults to 1/2.
+        draw (str, optional): The symbols that draw a step. Defaults to "F".
+        group (bool, optional): If False, adds one submobject per step, nested under
+            the steps of lower levels. Defaults to True.
+        compact (bool, optional): If True with group False, keeps the steps in one
+            VMobject that is indexed like the submobjects of group False and stores
+            stroke colors and widths per step. Defaults to False.
+        lod (bool | Mobject, optional): If True, or a camera frame, stops at the level
+            where steps fit in a pixel. Defaults to False.
+        **kwargs: Additional keyword arguments passed to VMobject.
+
+    Methods:
+        new_level(level, length, point):
+            Rebuilds at the given level, length and point.
+        next_level():
+            Rebuilds one level higher.
+        prev_level():
+            Rebuilds one level lower.
+        export(path, level, chunk_size):
+            Streams a level to an .npy, .svg or .csv file without building it.
+        set_segment_stroke(color, width, opacity):
+            Sets the stroke of each step of a compact curve.
+        update_lod():
+            Emits the level of detail for the current size and camera frame.
+    """
+
+    cache = _LevelCache()
+    axiom = "F"
+    rules = {}
+    angle = PI / 2
+    heading = 0
+    ratio = 1 / 2
+    draw = "F"
+    # scales every level to a bounding box of side length, for curves that grow
+    fit = False
+    _segment_rgbas = None
+    _segment_widths = None
 
-class KochCurve(VMobject):
     def __init__(
         self,
         level=0,
-        length=config.frame_width * 3 / 4,
+        length=config.frame_height * 3 / 4,
         point=ORIGIN,
+        axiom=None,
+        rules=None,
+        angle=None,
+        heading=None,
+        ratio=None,
+        draw=None,
         group=True,
-        **kwargs
+        compact=False,
+        lod=False,
+        **kwargs,
     ):
         super().__init__(**kwargs)
 
+        system = {
+            "axiom": axiom,
+            "rules": rules,
+            "angle": angle,
+            "heading": heading,
+            "ratio": ratio,
+            "draw": draw,
+        }
+        system = {k: v for k, v in system.items() if v is not None}
+        self.__dict__.update(system)
+
         self.level = 0 if level < 0 else level
         self.length = length
+        self.lod = lod
+        self._segment_rgbas = self._segment_widths = None
+        kwargs.update({**system, "group": group, "compact": compact, "lod": lod})
         self.kwargs = kwargs
-        self._koch_curve(self.level, self.length, point, group=group)
+        self._lsystem(self.level, self.length, point, group, compact)
 
-    def _koch_curve(self, level, length, point, group=True):
-        l = length / (3**level)
-        points = [LEFT * l / 2, RIGHT * l / 2]
-        self.set_points_as_corners(points)
-        vmob = self.copy()
-        for _ in range(level):
-            new_vmob = VGroup()
-            for i in (0, PI / 3, -PI / 3, 0):
-                new_vmob.add(vmob.copy().rotate(i))
-            new_vmob.arrange(RIGHT, buff=0, aligned_edge=DOWN)
-            vmob.become(new_vmob)
-        vmob.move_to(point)
+    def _lsystem(self, level, length, point, group=True, compact=False):
+        if self.lod and group:
+            level = self._lod_level(length)
+            self.add_updater(_lod_updater)
+        self.lod_level = level
+        points = self._level_points(level, group or compact) * length + point
         if group:
-            points = vmob.get_all_points()
             self.set_points(points)
+        elif compact:
+            self._segment_runs(points, level)
         else:
-            self.become(vmob)
+            self._segment_group(points, level)
+
+    def _level_points(self, level, group=True):
+        """Gets cached unit step points centered at ORIGIN, as corners if not group."""
+        rules = tuple(sorted(self.rules.items()))
+        system = (self.axiom, rules, self.angle, self.heading, self.ratio, self.draw)
+        key = (type(self), system, level, group)
+        return self.cache.get(key, lambda: self._corners(level, group))
+
+    def _corners(self, level, group):
+        z = _lsystem_corners(self.axiom, self.rules, self.angle, level, draw=self.draw)
+        chord = z[-1] - z[0]
+        if abs(chord) > 1e-9 * len(z):
+            z *= np.exp(-1j * np.angle(chord))
+        z *= np.exp(1j * self.heading) * self.ratio**level
+        corners = _complex_to_points(z)
+        corners -= (corners.min(0) + corners.max(0)) / 2
+        if self.fit:
+            corners /= np.ptp(corners, axis=0).max()
+        return _corners_to_points(corners) if group else corners
+
+    def _growth(self):
+        """Gets the symbols and how many of each one every symbol is replaced with."""
+        symbols = sorted(
+            set(self.axiom + "".join(self.rules.values())) | set(self.rules)
+        )
+        growth = np.array(
+            [[self.rules.get(a, a).count(b) for b in symbols] for a in symbols]
+        )
+        return symbols, growth
+
+    def _num_segments(self, level):
+        """Counts the steps of a level without expanding the symbols."""
+        symbols, growth = self._growth()
+        counts = np.array([self.axiom.count(a) for a in symbols])
+        for _ in range(level):
+            counts = counts @ growth
+        return sum(n for a, n in zip(symbols, counts) if a in self.draw)
+
+    def _segment_group(self, corners, level):
+        """Nests one submobject per segment under its segment of the previous level."""
+        vmob = self.copy()
+        vmobs = [
+            vmob.copy().set_points_as_corners(ends)
+            for ends in zip(corners[:-1], corners[1:])
+        ]
+        counts = [self._num_segments(i) for i in range(level + 1)]
+        k = counts[-1] // counts[-2] if level and counts[-2] else 1
+        if all(n == counts[0] * k**i for i, n in enumerate(counts)):
+            for _ in range(level):
+                vmobs = [
+                    vmob.copy().add(*vmobs[i : i + k]) for i in range(0, len(vmobs), k)
+                ]
+        if len(vmobs) == 1 and not vmobs[0].submobjects:
+            self.set_points(vmobs[0].points)
+        elif len(vmobs) == 1:
+            self.add(*vmobs[0].submobjects)
+        else:
+            self.add(*vmobs)
+
+    def _nesting_sizes(self, level):
+        """Gets the number of steps in each nested view of a level, from the top."""
+        counts = [self._num_segments(i) for i in range(level + 1)]
+        k = counts[-1] // counts[-2] if level and counts[-2] else 1
+        if all(n == counts[0] * k**i for i, n in enumerate(counts)):
+            sizes = [k ** (level - i) for i in range(level + 1)]
+        else:
+            sizes = [1]
+        return sizes[1:] if sizes[0] == counts[-1] > 1 else sizes
+
+    def _segment_runs(self, points, level):
+        """Stores the style of each step and draws runs of equal style as submobjects."""
+        self._segment_sizes = self._nesting_sizes(level)
+        n = self._num_segments(level)
+        self._segment_rgbas = np.tile(self.get_stroke_rgbas()[0], (n, 1))
+        self._segment_widths = np.full(n, self.get_stroke_width(), dtype=float)
+        self._run_starts = np.zeros(1, dtype=int)
+        self.add(VMobject().set_points(points).match_style(self))
+        self._run_curves = [len(points) // 4]
+
+    @property
+    def segment_rgbas(self):
+        """The stroke color and opacity of each step of a compact curve, or None."""
+        if self._segment_rgbas is not None:
+            self._sync_segments()
+        return self._segment_rgbas
+
+    @property
+    def segment_widths(self):
+        """The stroke width of each step of a compact curve, or None."""
+        if self._segment_widths is not None:
+            self._sync_segments()
+        return self._segment_widths
+
+    def _sync_segments(self):
+        """Copies the stroke of the runs to their steps.
+
+        If the runs no longer draw the steps, as after a Transform or become, the steps
+        are rebuilt from the runs, nested as the level they draw if there is one.
+        """
+        runs = self.submobjects
+        curves = [run.get_num_curves() for run in runs]
+        if curves != self._run_curves:
+            self.submobjects = runs = [run for run in runs if run.has_points()]
+            curves = [run.get_num_curves() for run in runs]
+            n = sum(curves)
+            if n != len(self._segment_widths):
+                level = self._drawn_level(n)
+                self._segment_sizes = (
+                    [1] if level is None else self._nesting_sizes(level)
+                )
+                self._segment_rgbas = np.zeros((n, 4))
+                self._segment_widths = np.zeros(n)
+            self._run_starts = np.cumsum([0] + curves[:-1])
+            self._run_curves = curves
+        if not runs:
+            return
+
+        self._segment_rgbas[:] = np.repeat(
+            [run.get_stroke_rgbas()[0] for run in runs], curves, 0
+        )
+        self._segment_widths[:] = np.repeat(
+            [run.get_stroke_width() for run in runs], curves
+        )
+
+    def _set_runs(self, starts):
+        """Draws runs of steps from starts, keeping the runs that draw the same steps."""
+        rgbas, widths = self._segment_rgbas, self._segment_widths
+        runs = self.submobjects
+        points = np.concatenate([run.points for run in runs])
+        old = np.append(self._run_starts, len(widths)).tolist()
+        kept = dict(zip(zip(old, old[1:]), runs))
+        steps = np.append(starts, len(widths))
+        bounds = 4 * (steps * (len(points) // 4) // len(widths))
+        vmob = VMobject().match_style(runs[0])
+
+        new_runs = []
+        for i, start in enumerate(starts):
+            run = kept.get((steps[i], steps[i + 1]))
+            if run is None:
+                run = vmob.copy().set_points(points[bounds[i] : bounds[i + 1]])
+            color = ManimColor.from_rgb(rgbas[start, :3])
+            new_runs.append(run.set_stroke(color, widths[start], rgbas[start, 3]))
+        self.submobjects = []
+        self.add(*new_runs)
+        self._run_starts = starts
+        self._run_curves = [run.get_num_curves() for run in new_runs]
+
+    def _runs_of(self, indices):
+        """Splits the runs at the ends of the steps and returns the runs drawing them."""
+        self._sync_segments()
+        selected = np.zeros(len(self._segment_widths), dtype=bool)
+        selected[indices] = True
+        changes = np.flatnonzero(selected[1:] != selected[:-1]) + 1
+        starts = np.union1d(self._run_starts, changes)
+        if len(starts) > len(self._run_starts):
+            self._set_runs(starts)
+        return [run for run, start in zip(self.submobjects, starts) if selected[start]]
+
+    def _set_segment_stroke(self, indices, color=None, width=None, opacity=None):
+        self._sync_segments()
+        rgbas, widths = self._segment_rgbas, self._segment_widths
+
+        if color is not None:
+            colors = color if isinstance(color, list) else [color]
+            colors = [ManimColor(c).to_rgb() for c in colors]
+            rgbas[indices, :3] = _spread(colors, len(indices))
+        if opacity is not None:
+            rgbas[indices, 3] = _spread(opacity, len(indices))
+        if width is not None:
+            widths[indices] = _spread(width, len(indices))
+
+        changes = np.any(rgbas[1:] != rgbas[:-1], axis=1) | (widths[1:] != widths[:-1])
+        self._set_runs(np.append(0, np.flatnonzero(changes) + 1))
+
+    def set_segment_stroke(self, color=None, width=None, opacity=None):
+        """Sets the stroke of each step, stretching sequences over the steps."""
+
+        self._sync_segments()
+        indices = np.arange(len(self._segment_widths))
+        self._set_segment_stroke(indices, color, width, opacity)
+        return self
+
+    def _segments(self):
+        self._sync_segments()
+        return _Segments(self, np.arange(len(self._segment_widths)))
+
+    def __getitem__(self, value):
+        if self._segment_rgbas is None:
+            return super().__getitem__(value)
+        return self._segments()[value]
+
+    def __iter__(self):
+        if self._segment_rgbas is None:
+            return super().__iter__()
+        return iter(self._segments())
+
+    def __len__(self):
+        if self._segment_rgbas is None:
+            return super().__len__()
+        return len(self._segments())
+
+    def align_points(self, vmobject):
+        """Splits each curve of the lower level into the pieces of the higher one."""
+        n1, n2 = self.get_num_curves(), vmobject.get_num_curves()
+        if isinstance(vmobject, LSystem) and min(n1, n2) > 0:
+            low = self if n1 < n2 else vmobject
+            k, r = divmod(max(n1, n2), min(n1, n2))
+            if k > 1 and r == 0:
+                high = vmobject if low is self else self
+                t = _chord_params(high.points, k)
+                low.set_points(_split_curves(low.points, t))
+        return super().align_points(vmobject)
+
+    def null_point_align(self, mobject):
+        """Splits a segment aligned with a group into a piece per submobject."""
+        for m1, m2 in (self, mobject), (mobject, self):
+            if isinstance(m2, LSystem) and m1.submobjects and not m2.submobjects:
+                if m1.has_no_points() and m2.has_points():
+                    m2._split_segment(len(m1.submobjects))
+        return super().null_point_align(mobject)
+
+    def _split_segment(self, k):
+        pieces = np.split(_split_curves(self.points, np.linspace(0, 1, k + 1)), k)
+        vmobs = [self.copy().set_points(piece) for piece in pieces]
+        self.clear_points()
+        self.add(*vmobs)
+
+    def _lod_level(self, length):
+        """Gets the level at which steps fit in a pixel, for a level 0 step this long."""
+        width = config.frame_width if self.lod is True else self.lod.width
+        pixels = length * config.pixel_width / width
+        level = int(np.ceil(np.log(max(pixels, 1)) / -np.log(self.ratio)))
+        return min(level, self.level)
+
+    def _drawn_level(self, num_curves=None):
+        """Gets the lowest level with as many steps as the curve draws, or None."""
+        if num_curves is None:
+            num_curves = sum(m.get_num_curves() for m in self.get_family())
+        for level in range(64):
+            count = self._num_segments(level)
+            if count == num_curves > 0:
+                return level
+            if count > num_curves:
+                return None
+        return None
+
+    def update_lod(self):
+        """Emits the level of detail that matches the current size and camera frame."""
+
+        level = self._drawn_level(self.get_num_curves())
+        if level is None:
+            return self
+
+        # a Transform or become can draw a higher level than was built
+        self.level = max(self.level, level)
+        self.lod_level = level
+        matrix, shift = _affine_fit(self._level_points(level), self.points)
+        lod_level = self._lod_level(np.linalg.norm(matrix, 2))
+        if lod_level == level:
+            return self
+
+        p = self._level_points(lod_level)
+        points = np.empty_like(p)
+        points[:, :2] = p[:, :2] @ matrix.T + shift
+        points[:, 2] = self.points[0, 2]
+        self.set_points(points)
+        self.lod_level = lod_level
+
+        return self
+
+    def _corner_chunks(self, level, chunk_size):
+        """Yields the turtle corners of a level in chunks, expanding one piece at a time."""
+
+        symbols, growth = self._growth()
+        sizes = np.ones(len(symbols), dtype=np.int64)
+        depth = 0
+        while depth < level and (growth @ sizes).max() <= chunk_size:
+            sizes = growth @ sizes
+            depth += 1
+
+        table = str.maketrans(self.rules)
+        pieces = {}
+        for a in symbols:
+            text = a
+            for _ in range(depth):
+                text = text.translate(table)
+            corners = _lsystem_corners(text, {}, self.angle, 0, draw=self.draw)
+            pieces[a] = corners[1:], text.count("+") - text.count("-")
+
+        def walk(text, level):
+            for a in text:
+                if level == 0:
+                    yield a
+                else:
+                    yield from walk(self.rules.get(a, a), level - 1)
+
+        start, turns = 0j, 0
+        yield np.zeros(1, dtype=complex)
+        for a in walk(self.axiom, level - depth):
+            corners, turn = pieces[a]
+            if len(corners):
+                corners = start + np.exp(1j * self.angle * turns) * corners
+                start = corners[-1]
+                yield corners
+            turns += turn
+
+    def _stream_frame(self, level, chunk_size):
+        """Gets the transform and bounding box that normalize streamed corners."""
+
+        for corners in self._corner_chunks(level, chunk_size):
+            end = corners[-1]
+        transform = np.exp(1j * self.heading) * self.ratio**level
+        if abs(end) > 1e-9 * (self._num_segments(level) + 1):
+            transform *= np.exp(-1j * np.angle(end))
+
+        low, high = np.inf, -np.inf
+        for corners in self._corner_chunks(level, chunk_size):
+            corners = _complex_to_points(corners * transform)
+            low = np.minimum(low, corners.min(0))
+            high = np.maximum(high, corners.max(0))
+
+        if self.fit:
+            size = (high - low).max()
+            transform, low, high = transform / size, low / size, high / size
+
+        return transform, low, high
+
+    def export(self, path, level=None, chunk_size=2**16):
+        """
+        Streams a level to a file without building it, holding one chunk at a time.
+
+        Args:
+            path (str): The output file. A .npy file is memory-mapped and gets the
+                cubic Bezier points, a .svg file gets a path and a .csv file gets
+                the corners.
+            level (int, optional): The level to export. Defaults to the current level.
+            chunk_size (int, optional): The most symbols expanded at once. Defaults to 2**16.
+
+        Returns:
+            str: The path of the output file.
+        """
+
+        if level is None:
+            # the drawn level, or the built one if a level of detail is drawn instead
+            drawn = self._drawn_level()
+            level = self.level if drawn in (None, self.lod_level) else drawn
+        transform, low, high = self._stream_frame(level, chunk_size)
+        center = (low + high) / 2
+        point = self.get_center()
+
+        def chunks():
+            for corners in self._corner_chunks(level, chunk_size):
+                corners = _complex_to_points(corners * transform) - center
+                yield corners * self.length + point
+
+        fmt = os.path.splitext(path)[1].lower()
+        if fmt == ".npy":
+            shape = (4 * int(self._num_segments(level)), 3)
+            array = np.lib.format.open_memmap(path, "w+", float, shape)
+            i, last = 0, None
+            for corners in chunks():
+                if last is not None:
+                    points = _corners_to_points(np.concatenate((last, corners)))
+                    array[i : i + len(points)] = points
+                    i += len(points)
+                last = corners[-1:]
+            array.flush()
+            del array
+
+        elif fmt == ".svg":
+            size = (high - low) * self.length
+            width = self.get_stroke_width() / 100
+            x, y = point[0] - size[0] / 2, -point[1] - size[1] / 2
+            view = (
+                f"{x - width} {y - width} {size[0] + 2 * width} {size[1] + 2 * width}"
+            )
+            stroke = self.get_stroke_color().to_hex()
+            fill = self.get_fill_color().to_hex()
+            opacity = self.get_fill_opacity()
+            with open(path, "w") as file:
+                file.write(
+                    f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view}">\n'
+                    f'<path fill="{fill}" fill-opacity="{opacity}" stroke="{stroke}" '
+                    f'stroke-width="{width}" stroke-linejoin="round" d="M'
+                )
+                for corners in chunks():
+                    corners[:, 1] *= -1
+                    np.savetxt(file, corners[:, :2], fmt="%.6f", newline=" ")
+                file.write('"/>\n</svg>\n')
+
+        elif fmt == ".csv":
+            with open(path, "w") as file:
+                file.write("x,y,z\n")
+                for corners in chunks():
+                    np.savetxt(file, corners, fmt="%.9f", delimiter=",")
+
+        else:
+            raise ValueError(f"Unsupported export format: {fmt or path}")
+
+        return path
 
     def new_level(self, level=None, length=None, point=None, **kwargs):
         level = self.level if level is None else level
@@ -52,7 +816,28 @@ class KochCurve(VMobject):
         self.new_level(level, **kwargs)
 
 
-class KochSnowflake(KochCurve):
+class KochCurve(LSystem):
+    rules = {"F": "F+F--F+F"}
+    angle = PI / 3
+    ratio = 1 / 3
+
+    def __init__(
+        self,
+        level=0,
+        length=config.frame_width * 3 / 4,
+        point=ORIGIN,
+        group=True,
+        **kwargs,
+    ):
+        super().__init__(level, length, point, group=group, **kwargs)
+
+
+class KochSnowflake(LSystem):
+    axiom = "F--F--F"
+    angle = PI / 3
+    heading = -PI / 3
+    ratio = 1 / 3
+
     def __init__(
         self,
         level=0,
@@ -62,7 +847,7 @@ class KochSnowflake(KochCurve):
         fill_opacity=1,
         stroke_width=0,
         color=BLUE,
-        **kwargs
+        **kwargs,
     ):
         kwargs.update(
             {
@@ -72,30 +857,78 @@ class KochSnowflake(KochCurve):
             }
         )
 
-        super().__init__(**kwargs)
+        self.rules = {"F": "F-F++F-F" if invert else "F+F--F+F"}
 
-        self.level = 0 if level < 0 else level
-        self.length = length
-        kwargs.update({"invert": invert})
-        self.kwargs = kwargs
-        self._koch_snowflake(self.level, self.length, point, invert)
+        super().__init__(level, length, point, **kwargs)
 
-    def _koch_snowflake(self, level, length, point, invert):
+        self.kwargs.update({"invert": invert})
+        self._sides = None
 
-        self._koch_curve(level, length, point, group=True)
+    @property
+    def sides(self):
+        """The three sides as outlines, created on first access."""
+
+        if self._sides is None:
+            sides = VGroup(
+                *[
+                    VMobject().set_points(side).match_style(self)
+                    for side in np.split(self.points, 3)
+                ]
+            )
+            self._sides = sides.set_style(fill_opacity=0, stroke_width=4)
+
+        return self._sides
+
+
+class SierpinskiArrowhead(LSystem):
+    axiom = "A"
+    rules = {"A": "B-A-B", "B": "A+B+A"}
+    angle = PI / 3
+    draw = "AB"
+
+
+class DragonCurve(LSystem):
+    rules = {"F": "F+G", "G": "F-G"}
+    draw = "FG"
+    ratio = 1 / np.sqrt(2)
+
+
+class LevyCurve(LSystem):
+    rules = {"F": "+F--F+"}
+    angle = PI / 4
+    ratio = 1 / np.sqrt(2)
+
+
+class HilbertCurve(LSystem):
+    """A Hilbert curve that fills a square of side length at every level."""
+
+    axiom = "+BF-AFA-FB+"
+    rules = {"A": "+BF-AFA-FB+", "B": "-AF+BFB+FA-"}
+    fit = True
 
-        if invert:
-            self.rotate(PI).reverse_direction()
-            kc2 = self.copy().rotate(PI, about_point=self.get_top())
-        else:
-            kc2 = self.copy().rotate(PI, about_point=self.get_bottom())
 
-        kc1 = self.copy().rotate(-PI / 3, about_point=self.get_end())
-        kc3 = self.copy().rotate(PI / 3, about_point=self.get_start())
-        ks = VGroup(kc1, kc2, kc3).move_to(point)
+if __name__ == "__main__":
+    import argparse
 
-        points = ks.get_all_points()
+    names = [cls.__name__ for cls in LSystem.__subclasses__()]
+    parser = argparse.ArgumentParser(
+        description="Streams an L-system fractal level to an .npy, .svg or .csv file."
+    )
+    parser.add_argument("fractal", choices=names)
+    parser.add_argument("level", type=int)
+    parser.add_argument("path")
+    parser.add_argument("--length", type=float, help="length of a level 0 step")
+    parser.add_argument("--chunk-size", type=int, default=2**16)
+    args = parser.parse_args()
 
-        self.sides = ks.set_style(fill_opacity=0, stroke_width=4)
+    fmt = os.path.splitext(args.path)[1].lower()
+    if fmt not in (".npy", ".svg", ".csv"):
+        parser.error(f"unsupported export format: {fmt or args.path}")
+    if args.level < 0:
+        parser.error(f"level must be at least 0, got {args.level}")
+    if args.chunk_size < 1:
+        parser.error(f"--chunk-size must be at least 1, got {args.chunk_size}")
 
-        self.set_points_as_corners(points)
+    kwargs = {} if args.length is None else {"length": args.length}
+    fractal = globals()[args.fractal](**kwargs)
+    fractal.export(args.path, args.level, args.chunk_size)
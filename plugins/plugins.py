@@ -2,3 +2,4 @@
 from .roulette import *
 from .fractal import *
 from .anim import *
+from .text import *
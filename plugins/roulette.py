@@ -1,6 +1,285 @@
+import weakref
+from functools import lru_cache
+
 from manim import *
 
 
+@lru_cache(maxsize=64)
+def _dashed_circle(num_dashes):
+    """Gets the shared dashed unit circle that wheels copy, one per number of dashes."""
+
+    return DashedVMobject(
+        Circle(radius=1, stroke_width=5, color=BLUE), num_dashes=num_dashes
+    )
+
+
+def _fit_cubics(points):
+    """Gets the cubic Bézier curves through each run of 4 evenly sampled points."""
+
+    # a cubic through samples at t = 0, 1/3, 2/3, 1 has these control points
+    t = np.linspace(0, 1, 4)[:, None]
+    j = np.arange(4)
+    bernstein = np.array([1, 3, 3, 1]) * t**j * (1 - t) ** (3 - j)
+    index = 3 * np.arange((len(points) - 1) // 3)[:, None] + j
+    return np.linalg.inv(bernstein) @ points[index]
+
+
+class _PathTable:
+    """Arc-length lookup table of the curves of a VMobject with their tangent angles.
+
+    Corners appear as two samples at the same point, with the tangent turning between them.
+    """
+
+    def __init__(self, vmob, samples_per_curve=32):
+        curves = np.concatenate(
+            [mob.points for mob in vmob.family_members_with_points()]
+        ).reshape(-1, 4, 3)
+        size = np.abs(np.diff(curves, axis=1)).sum(axis=(1, 2))
+        curves = curves[size > 1e-9 * max(size.max(initial=0), 1)]
+        if not len(curves):
+            raise ValueError("Cannot roll along a path without curves")
+
+        t = np.linspace(0, 1, samples_per_curve + 1)[:, None]
+        points = (
+            (1 - t) ** 3 * curves[:, None, 0]
+            + 3 * t * (1 - t) ** 2 * curves[:, None, 1]
+            + 3 * t**2 * (1 - t) * curves[:, None, 2]
+            + t**3 * curves[:, None, 3]
+        )
+        derivatives = 3 * (
+            (1 - t) ** 2 * (curves[:, None, 1] - curves[:, None, 0])
+            + 2 * t * (1 - t) * (curves[:, None, 2] - curves[:, None, 1])
+            + t**2 * (curves[:, None, 3] - curves[:, None, 2])
+        )
+
+        # chords stand in for the tangent where a handle sits on its anchor
+        chords = np.diff(points, axis=1)
+        chords = np.concatenate([chords, chords[:, -1:]], axis=1)
+        speed = np.linalg.norm(derivatives, axis=2, keepdims=True)
+        tangents = np.where(speed > 1e-9, derivatives, chords).reshape(-1, 3)
+
+        self.points = points.reshape(-1, 3)
+        steps = np.linalg.norm(np.diff(self.points, axis=0), axis=1)
+        self.lengths = np.append(0, np.cumsum(steps))
+        self.angles = np.unwrap(np.arctan2(tangents[:, 1], tangents[:, 0]))
+
+    def rolling(self, radius, side):
+        """Gets the rolling distances, anchors, offsets and spins of a wheel on one side of the path.
+
+        The wheel center sits at its offset along the normal from its anchor. The wheel pivots around corners that are convex on its side. At concave corners it is clamped where it touches both sides, and switches sides without turning.
+        """
+
+        points, lengths = self.points, self.lengths
+        steps, turns = np.diff(lengths), np.diff(self.angles)
+        normals = np.stack(
+            [-np.sin(self.angles), np.cos(self.angles), np.zeros_like(self.angles)],
+            axis=-1,
+        )
+        anchors, offsets = points.copy(), np.full(len(points), side * radius)
+
+        corners = steps < 1e-12
+        convex = corners & (side * turns < 0)
+        moves = np.where(convex, radius * np.abs(turns), steps)
+        # a wheel on the left turns clockwise as it rolls, and with the path
+        spins = turns - side * steps / radius
+
+        clamped = np.zeros(len(points), dtype=bool)
+        for k in np.flatnonzero(corners & (side * turns > 0)):
+            half = min(abs(turns[k]) / 2, PI / 2 - 1e-6)
+            near = np.abs(lengths - lengths[k]) < radius * np.tan(half) + 1e-12
+            bisector = (normals[k] + normals[k + 1]) / (2 * np.cos(half) ** 2)
+            anchors[near] = points[k] + side * radius * bisector
+            offsets[near] = 0
+            clamped |= near
+
+        # the wheel rolls straight onto and off a clamped point
+        edges = clamped[:-1] != clamped[1:]
+        centers = anchors + offsets[:, None] * normals
+        moves[edges] = np.linalg.norm(np.diff(centers, axis=0)[edges], axis=1)
+        spins[edges] = -side * moves[edges] / radius
+        inside = clamped[:-1] & clamped[1:]
+        moves[inside] = spins[inside] = 0
+
+        distances = np.append(0, np.cumsum(moves))
+        spins = np.append(0, np.cumsum(spins))
+        return distances, anchors, offsets, spins
+
+
+class _WheelBatch:
+    """Dashed circles, center dots, marker dots and marker lines of wheels bound to contiguous buffers."""
+
+    def __init__(self, wheels):
+        self.wheels = wheels
+
+        # circles turn by their angle since begin() about their own center
+        circles = [wheel.circle.family_members_with_points() for wheel in wheels]
+        self.circle_index = np.flatnonzero([len(dashes) for dashes in circles])
+        self.circle_angles = np.array([wheel.circle.angle for wheel in wheels])
+        sizes = [
+            sum(len(dash.points) for dash in circles[i]) for i in self.circle_index
+        ]
+        self.circle_starts = np.append(0, np.cumsum(sizes)[:-1]).astype(int)
+        self.circle_slot = np.repeat(np.arange(len(sizes)), sizes)
+        self.circle_owner = self.circle_index[self.circle_slot]
+        self.circle_offsets = np.concatenate(
+            [
+                np.concatenate([dash.points for dash in circles[i]])
+                - wheels[i].circle.get_center()
+                for i in self.circle_index
+            ]
+            or [np.zeros((0, 3))]
+        )
+        self.circles = self.circle_offsets.copy()
+        start = 0
+        for i in self.circle_index:
+            for dash in circles[i]:
+                dash.points = self.circles[start : start + len(dash.points)]
+                start += len(dash.points)
+
+        markers = [marker for wheel in wheels for marker in wheel.markers]
+        self.markers = markers
+        self.owner = np.repeat(
+            np.arange(len(wheels)), [len(wheel.markers) for wheel in wheels]
+        )
+        self.distances = np.array([m.distance for m in markers], dtype=float)
+        self.thetas = np.array([m.theta for m in markers], dtype=float)
+        self.wheel_angles = self.circle_angles
+        self.angles = self.thetas.copy()
+
+        # dots keep their shape relative to the center they are moved to
+        dots = [wheel.dot for wheel in wheels] + [m.dot for m in markers]
+        sizes = [len(dot.points) for dot in dots]
+        self.dot_owner = np.repeat(np.arange(len(dots)), sizes)
+        self.dot_offsets = np.concatenate(
+            [dot.points - dot.get_center() for dot in dots] or [np.zeros((0, 3))]
+        )
+        self.dots = self.dot_offsets.copy()
+        bounds = np.append(0, np.cumsum(sizes))
+        for dot, start, end in zip(dots, bounds, bounds[1:]):
+            dot.points = self.dots[start:end]
+
+        lines = [(i, m.line) for i, m in enumerate(markers) if m.line is not None]
+        self.line_index = np.array([i for i, _ in lines], dtype=int)
+        self.lines = np.zeros((4 * len(lines), 3))
+        for i, (_, line) in enumerate(lines):
+            line.points = self.lines[4 * i : 4 * i + 4]
+
+    def markers_at(self, centers, angles):
+        """Gets marker angles and marker dot centers for wheel centers and rotation angles.
+
+        Leading axes of centers and angles are kept, so a whole trajectory can be evaluated at once.
+        """
+
+        angles = angles[..., self.owner] + self.thetas
+        ends = centers[..., self.owner, :] + self.distances[:, None] * np.stack(
+            [np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=-1
+        )
+        return angles, ends
+
+    def place(self, centers, wheel_angles, angles, ends):
+        """Writes all circles, dots and lines for wheel centers and rotation angles, marker angles and marker dot centers."""
+
+        self.wheel_angles = wheel_angles
+        self.angles = angles
+
+        if len(self.circles):
+            turns = (wheel_angles - self.circle_angles)[self.circle_owner]
+            cos, sin = np.cos(turns), np.sin(turns)
+            x, y, z = self.circle_offsets.T
+            points = np.stack([cos * x - sin * y, sin * x + cos * y, z], axis=1)
+            # like move_to, the bounding box center goes to the wheel center
+            middles = (
+                np.minimum.reduceat(points, self.circle_starts)
+                + np.maximum.reduceat(points, self.circle_starts)
+            ) / 2
+            shifts = centers[self.circle_index] - middles
+            self.circles[:] = points + shifts[self.circle_slot]
+
+        self.dots[:] = (
+            self.dot_offsets + np.concatenate([centers, ends])[self.dot_owner]
+        )
+
+        t = np.linspace(0, 1, 4)[:, None]
+        starts = centers[self.owner[self.line_index], None]
+        ends = ends[self.line_index, None]
+        self.lines.reshape(-1, 4, 3)[:] = (1 - t) * starts + t * ends
+
+    def write_angles(self):
+        """Stores the current wheel and marker angles back on the circles and markers."""
+
+        for wheel, start, angle in zip(
+            self.wheels, self.circle_angles, self.wheel_angles.tolist()
+        ):
+            wheel.circle.rotate_sheen_direction(angle - start)
+            wheel.circle.angle = angle
+
+        for marker, angle in zip(self.markers, self.angles.tolist()):
+            marker.angle = angle
+
+
+class _Roll(Animation):
+    """Moves wheels along a path giving their centers and rotation angles for each alpha.
+
+    With samples set, the path is tabulated once in begin() and frames interpolate the
+    centers and rotation angles in the table instead of evaluating the path. Markers are
+    placed on the interpolated wheel, so they stay on its rim between samples.
+    """
+
+    def __init__(
+        self,
+        mobject,
+        path,
+        wheels=None,
+        samples=None,
+        suspend_mobject_updating=False,
+        **kwargs,
+    ):
+        self.path = path
+        self.wheels = [mobject] if wheels is None else wheels
+        self.samples = samples
+        self.progress = 0.0
+        super().__init__(
+            mobject, suspend_mobject_updating=suspend_mobject_updating, **kwargs
+        )
+
+    def begin(self):
+        self.batch = _WheelBatch(self.wheels)
+        self.table = None
+        if self.samples:
+            if self.samples is True:
+                num = int(np.ceil(config.frame_rate * self.run_time)) + 1
+            else:
+                num = max(int(self.samples), 2)
+            self.table = self.path(np.linspace(0, 1, num))
+        super().begin()
+
+    def _frame(self, alpha):
+        """Gets centers, rotation angles, marker angles and marker dot centers at alpha."""
+
+        if self.table is None or not 0 <= alpha <= 1:
+            centers, angles = self.path(alpha)
+        else:
+            # linear interpolation between the two nearest samples
+            position = alpha * (len(self.table[0]) - 1)
+            index = min(int(position), len(self.table[0]) - 2)
+            t = position - index
+            centers, angles = (
+                (1 - t) * column[index] + t * column[index + 1] for column in self.table
+            )
+        return centers, angles, *self.batch.markers_at(centers, angles)
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        self.progress = self.rate_func(alpha)
+        self.batch.place(*self._frame(self.progress))
+
+    def finish(self):
+        super().finish()
+        self.batch.write_angles()
+
+
 class Wheel(VGroup):
     """A class representing a rolling circle that rolls without sliding along a straight line or around another circle, with markers tracing cycloids as it moves. This allows for the simulation of rolling motion and the generation of cycloidal curves for various configurations."""
 
@@ -12,7 +291,7 @@ class Wheel(VGroup):
         point=ORIGIN,
         num_dashes=None,
         angle=None,
-        **kwargs
+        **kwargs,
     ):
         super().__init__(**kwargs)
 
@@ -23,11 +302,12 @@ class Wheel(VGroup):
         if num_dashes is None:
             num_dashes = int(14 * radius)
 
-        self.circle = DashedVMobject(
-            Circle(
-                arc_center=self.point, radius=self.radius, stroke_width=5, color=color
-            ),
-            num_dashes=num_dashes,
+        self.circle = (
+            _dashed_circle(num_dashes)
+            .copy()
+            .scale(self.radius, about_point=ORIGIN)
+            .shift(self.point)
+            .set_color(color)
         )
 
         if angle is not None:
@@ -174,8 +454,8 @@ class Wheel(VGroup):
 
         return anim
 
-    def trace_paths(self, idx=None, stroke_width=4, **kwargs):
-        """Traces the path of markers."""
+    def trace_roulettes(self, roll, idx=None, stroke_width=4, **kwargs):
+        """Gets the exact curves markers trace during a roll, revealed as the roll plays."""
 
         if idx is None:
             markers = VGroup(*self.markers)
@@ -186,16 +466,53 @@ class Wheel(VGroup):
 
         for marker in markers:
             paths.add(
-                TracedPath(
-                    marker.dot.get_center,
+                Roulette(
+                    roll,
+                    marker,
                     stroke_color=marker.dot.color,
                     stroke_width=stroke_width,
-                    **kwargs
+                    **kwargs,
                 )
             )
 
         return paths
 
+    def trace_paths(
+        self, idx=None, stroke_width=4, capacity=None, fade=False, **kwargs
+    ):
+        """Traces the path of markers.
+
+        With capacity set, each trace keeps only its latest curves in a ring buffer, optionally fading them by age, so long rolls stay at a constant cost.
+        """
+
+        if idx is None:
+            markers = VGroup(*self.markers)
+        else:
+            markers = VGroup(*[self.markers[i] for i in idx])
+
+        paths = VGroup()
+
+        for marker in markers:
+            if capacity is None:
+                path = TracedPath(
+                    marker.dot.get_center,
+                    stroke_color=marker.dot.color,
+                    stroke_width=stroke_width,
+                    **kwargs,
+                )
+            else:
+                path = RingTracedPath(
+                    marker.dot.get_center,
+                    capacity=capacity,
+                    fade=fade,
+                    stroke_color=marker.dot.color,
+                    stroke_width=stroke_width,
+                    **kwargs,
+                )
+            paths.add(path)
+
+        return paths
+
     def roll(
         self,
         direction,
@@ -203,9 +520,13 @@ class Wheel(VGroup):
         reverse=False,
         rate_func=linear,
         run_time=2,
-        **kwargs
+        samples=None,
+        **kwargs,
     ):
-        """Rolls without sliding along a straight line or around another circle in the same plane."""
+        """Rolls without sliding along a straight line or around another circle in the same plane.
+
+        With samples=True the trajectory is tabulated once at the scene frame rate when the animation begins, and an integer sets the number of samples instead. Frames then interpolate the table, which keeps long high-fps rolls cheap and reproducible.
+        """
 
         self.point = self.dot.get_center()
 
@@ -242,10 +563,12 @@ class Wheel(VGroup):
         if reverse:
             distance *= -1
 
-        def update_alpha(self, alpha):
+        def path(alpha):
 
             angle = (alpha * distance) / self.radius
 
+            alpha = np.asarray(alpha)[..., None]
+
             if about is None:
 
                 point1 = self.point + alpha * direction
@@ -254,36 +577,371 @@ class Wheel(VGroup):
 
                 point1_angle = alpha * direction + theta
 
-                point1 = ORIGIN + (
-                    np.cos(point1_angle) * radius,
-                    np.sin(point1_angle) * radius,
-                    0.0,
+                point1 = ORIGIN + np.concatenate(
+                    [
+                        np.cos(point1_angle) * radius,
+                        np.sin(point1_angle) * radius,
+                        np.zeros_like(point1_angle),
+                    ],
+                    axis=-1,
                 )
 
-            self.circle.rotate(angle - self.circle.angle).move_to(point1)
+            return point1[..., None, :], np.asarray(angle)[..., None]
 
-            self.circle.angle = angle
+        anim = _Roll(
+            self,
+            path,
+            samples=samples,
+            rate_func=rate_func,
+            run_time=run_time,
+            **kwargs,
+        )
 
-            self.dot.move_to(point1)
+        return anim
 
-            for marker in self.markers:
+    def roll_along(
+        self,
+        vmob,
+        start=0,
+        end=1,
+        rate_func=linear,
+        run_time=2,
+        samples=None,
+        **kwargs,
+    ):
+        """Rolls without sliding along the path of any VMobject, staying on the side of it the wheel is on.
 
-                point2_angle = angle + marker.theta
-                marker.angle = point2_angle
+        Start and end are proportions of the rolling distance along the path, and end below start rolls backwards. The path is looked up in an arc-length table built once, and the wheel pivots around corners.
+        """
 
-                point2 = point1 + (
-                    np.cos(point2_angle) * marker.distance,
-                    np.sin(point2_angle) * marker.distance,
-                    0.0,
-                )
+        self.point = self.dot.get_center()
 
-                if marker.line:
-                    marker.line.set_points_by_ends(point1, point2)
+        self.circle.angle = 0
+
+        for marker in self.markers:
+            marker.theta = marker.angle
+
+        table = _PathTable(vmob)
+
+        length = start * table.lengths[-1]
+        point = [np.interp(length, table.lengths, table.points[:, i]) for i in range(3)]
+        angle = np.interp(length, table.lengths, table.angles)
+        tangent = np.array([np.cos(angle), np.sin(angle), 0.0])
+        side = -1 if np.cross(tangent, self.point - point)[2] < 0 else 1
+
+        # rolling distance, where pivoting around a corner moves the center
+        distances, anchors, offsets, spins = table.rolling(self.radius, side)
+        distance1, distance2 = start * distances[-1], end * distances[-1]
+        spin1 = np.interp(distance1, distances, spins)
+
+        def path(alpha):
+
+            distance = distance1 + np.asarray(alpha) * (distance2 - distance1)
+
+            point = np.stack(
+                [np.interp(distance, distances, anchors[:, i]) for i in range(3)],
+                axis=-1,
+            )
+            offset = np.interp(distance, distances, offsets)[..., None]
+            angle = np.interp(distance, distances, table.angles)
+            normal = np.stack(
+                [-np.sin(angle), np.cos(angle), np.zeros_like(angle)], axis=-1
+            )
+            point1 = point + offset * normal
+            angle = np.interp(distance, distances, spins) - spin1
+
+            return point1[..., None, :], np.asarray(angle)[..., None]
+
+        anim = _Roll(
+            self,
+            path,
+            samples=samples,
+            rate_func=rate_func,
+            run_time=run_time,
+            **kwargs,
+        )
+
+        return anim
+
+
+class WheelTrain(VGroup):
+    """A tree of wheels where every wheel rolls without sliding around the outside or inside of its parent, such as a spirograph or a gear train.
+
+    The first wheel stays in place and may spin. Centers and rotations of all wheels are solved together, so a frame costs one array update however many wheels and markers there are.
+
+    Args:
+        wheel: The wheel at the root of the tree.
+        rate: The spin of the root wheel in radians per second.
+        **kwargs: Additional keyword arguments for VGroup.
+    """
+
+    def __init__(self, wheel, rate=0, **kwargs):
+        super().__init__(wheel, **kwargs)
+
+        self.wheels = [wheel]
+        self.parents = [-1]
+        self.rates = [rate]
+        self.distances = [0.0]
+        self.ratios = [0.0]
+
+    def add_wheel(self, wheel, parent=None, angle=0, rate=1, inside=False):
+        """Adds a wheel touching its parent in the given direction and orbiting it at the given rate in radians per second.
+
+        A wheel with rate 0 keeps its center and meshes with its parent like a gear.
+        """
+
+        if parent is None:
+            parent = self.wheels[0]
+
+        if inside:
+            distance = parent.radius - wheel.radius
+            ratio = -distance / wheel.radius
+        else:
+            distance = parent.radius + wheel.radius
+            ratio = distance / wheel.radius
+
+        wheel.move(
+            parent.dot.get_center()
+            + distance * np.array([np.cos(angle), np.sin(angle), 0.0])
+        )
+
+        self.wheels.append(wheel)
+        self.parents.append(self.wheels.index(parent))
+        self.rates.append(rate)
+        self.distances.append(distance)
+        self.ratios.append(ratio)
+
+        self.add(wheel)
+
+        return self
+
+    def roll(self, rate_func=linear, run_time=2, samples=None, **kwargs):
+        """Rolls every wheel of the train for run_time seconds."""
+
+        centers = np.array([wheel.dot.get_center() for wheel in self.wheels])
+
+        for wheel, center in zip(self.wheels, centers):
+            wheel.point = center
+            wheel.circle.angle = 0
+            for marker in wheel.markers:
+                marker.theta = marker.angle
+
+        num_wheels = len(self.wheels)
+        parents = np.array(self.parents)
+        rates = np.array(self.rates, dtype=float)
+        distances = np.array(self.distances)
+        ratios = np.array(self.ratios)
+
+        offsets = centers[1:] - centers[parents[1:]]
+        directions = np.append(0, np.arctan2(offsets[:, 1], offsets[:, 0]))
+
+        # a wheel turns with its parent, plus its ratio times its orbit around it,
+        # and its center is its parent's center plus its own offset
+        turns = np.zeros((num_wheels, num_wheels))
+        ancestors = np.eye(num_wheels)
+        for i in range(1, num_wheels):
+            turns[i, parents[i]] = 1 - ratios[i]
+            ancestors[i] += ancestors[parents[i]]
+        spins = np.linalg.solve(
+            np.eye(num_wheels) - turns, np.append(rates[0], ratios[1:] * rates[1:])
+        )
+
+        def path(alpha):
+
+            time = np.asarray(alpha)[..., None] * run_time
+
+            angles = directions + time * rates
+
+            offsets = distances[:, None] * np.stack(
+                [np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=-1
+            )
+
+            points = centers[0] + ancestors @ offsets
 
-                marker.dot.move_to(point2)
+            return points, time * spins
 
-        anim = UpdateFromAlphaFunc(
-            self, update_alpha, rate_func=rate_func, run_time=run_time, **kwargs
+        anim = _Roll(
+            self,
+            path,
+            wheels=self.wheels,
+            samples=samples,
+            rate_func=rate_func,
+            run_time=run_time,
+            **kwargs,
         )
 
         return anim
+
+    def trace_roulettes(self, roll, wheels=None, stroke_width=4, **kwargs):
+        """Gets the exact curves the markers of the given wheels trace during a roll."""
+
+        if wheels is None:
+            wheels = self.wheels
+
+        paths = VGroup()
+
+        for wheel in wheels:
+            paths.add(*wheel.trace_roulettes(roll, stroke_width=stroke_width, **kwargs))
+
+        return paths
+
+
+def _reveal_updater(roulette):
+    roll = roulette.roll_ref()
+    if roll is not None:
+        roulette.reveal(roll.progress)
+
+
+class Roulette(VMobject):
+    """The curve a wheel marker traces during a roll, such as a cycloid, trochoid, epicycloid or hypotrochoid.
+
+    The curve is fitted once from the closed-form marker position, so it does not depend on the frame rate, and is revealed up to the current progress of the roll at a constant cost per frame. Only a weak reference to the roll is kept, so copies follow the same roll without copying it or its wheels.
+
+    Args:
+        roll: The animation returned by Wheel.roll, Wheel.roll_along or WheelTrain.roll.
+        marker: A marker of a rolling wheel.
+        num_curves: The number of cubic Bézier curves, chosen from how far the wheel turns when None.
+        **kwargs: Additional keyword arguments for VMobject.
+    """
+
+    def __init__(self, roll, marker, num_curves=None, **kwargs):
+        super().__init__(**kwargs)
+
+        self.roll_ref = weakref.ref(roll)
+
+        distance, theta = marker.distance, marker.theta
+
+        index = next(
+            i
+            for i, wheel in enumerate(roll.wheels)
+            if marker in wheel.markers.submobjects
+        )
+
+        def center_path(alpha):
+            centers, angles = roll.path(alpha)
+            angles = np.broadcast_to(angles, (*alpha.shape, len(roll.wheels)))
+            return centers[..., index, :], angles[..., index]
+
+        def trace(alpha):
+            points, angles = center_path(alpha)
+            angles = angles + theta
+            return points + distance * np.stack(
+                [np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=-1
+            )
+
+        if num_curves is None:
+            # wheel turns plus turns of the path of the center
+            points, angles = center_path(np.linspace(0, 1, 65))
+            chords = np.diff(points, axis=0)
+            headings = np.unwrap(np.arctan2(chords[:, 1], chords[:, 0]))
+            turn = np.ptp(angles) + np.abs(np.diff(headings)).sum()
+            num_curves = max(int(np.ceil(turn * 64 / TAU)), 16)
+
+        self.curves = _fit_cubics(trace(np.linspace(0, 1, 3 * num_curves + 1)))
+        self._buffer = self.curves.copy()
+        self.progress = None
+        self.reveal(roll.progress)
+
+        self.add_updater(_reveal_updater)
+
+    def reveal(self, progress):
+        """Shows the curve up to the given proportion of the roll."""
+
+        if progress == self.progress:
+            return self
+
+        num_curves = len(self.curves)
+        position = np.clip(progress, 0, 1) * num_curves
+        index = min(int(position), num_curves - 1)
+        curve = self.curves[index]
+
+        # only the partial curve differs from the full curves
+        if self.progress is not None:
+            self._buffer[self._index] = self.curves[self._index]
+        if position > index:
+            self._buffer[index] = partial_bezier_points(curve, 0, position - index)
+        else:
+            self._buffer[index] = curve[0]
+
+        self.progress = progress
+        self._index = index
+        self.points = self._buffer[: index + 1].reshape(-1, 3)
+
+        return self
+
+
+class RingTracedPath(VMobject):
+    """Traces the path of a point like TracedPath, keeping only its latest curves in a fixed-size ring buffer.
+
+    Each frame writes one curve in place and shows the latest curves as a view of the buffer, so memory and render cost stop growing once the buffer is full.
+
+    Args:
+        traced_point_func: The function returning the traced point.
+        capacity: The number of latest curves kept, one per frame. Defaults to the frames in dissipating_time, or 240.
+        fade: Whether the trace fades out with age.
+        num_bands: The number of parts of increasing opacity the trace is drawn in when fading.
+        stroke_width: The width of the trace.
+        stroke_color: The color of the trace.
+        dissipating_time: The seconds the trace lasts, as in TracedPath, when capacity is None.
+        **kwargs: Additional keyword arguments for VMobject.
+    """
+
+    def __init__(
+        self,
+        traced_point_func,
+        capacity=None,
+        fade=False,
+        num_bands=8,
+        stroke_width=2,
+        stroke_color=WHITE,
+        dissipating_time=None,
+        **kwargs,
+    ):
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+
+        if capacity is None and dissipating_time is None:
+            capacity = 240
+        elif capacity is None:
+            capacity = max(int(np.ceil(dissipating_time * config.frame_rate)), 1)
+
+        self.traced_point_func = traced_point_func
+        self.dissipating_time = dissipating_time
+        self.capacity = capacity
+
+        # every curve is written twice so the latest ones are always one slice
+        self._ring = np.zeros((2 * capacity, 4, 3))
+        self._count = 0
+        self._last = None
+
+        if fade:
+            opacity = self.get_stroke_opacity()
+            self._bands = [
+                VMobject().match_style(self).set_stroke(opacity=opacity * k / num_bands)
+                for k in range(1, num_bands + 1)
+            ]
+            self.add(*self._bands)
+        else:
+            self._bands = [self]
+
+        self.add_updater(self.update_path)
+
+    def update_path(self, mob, dt):
+        point = np.array(self.traced_point_func())
+        last = point if self._last is None else self._last
+        slot = self._count % self.capacity
+        self._ring[slot] = self._ring[slot + self.capacity] = interpolate(
+            last, point, np.linspace(0, 1, 4)[:, None]
+        )
+        self._count += 1
+        self._last = point
+
+        length = min(self._count, self.capacity)
+        start = (self._count - length) % self.capacity
+        curves = self._ring[start : start + length]
+
+        # bands cover fixed age ranges, oldest first
+        num_bands = len(self._bands)
+        edges = np.linspace(-self.capacity, 0, num_bands + 1) + length
+        edges = np.clip(edges, 0, length).round().astype(int)
+        for band, lower, upper in zip(self._bands, edges, edges[1:]):
+            band.points = curves[lower:upper].reshape(-1, 3)
@@ -0,0 +1,322 @@
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partialmethod
+from importlib.metadata import version
+from pathlib import Path
+
+from manim import *
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+__all__ = ["text_cache", "cached_text", "cached_tex", "cached_math_tex"]
+
+
+def _is_plain(value):
+    """Checks that a value is a string, number, boolean or None, or a list of them."""
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    return type(value) in (str, int, float, bool, type(None))
+
+
+def _family_data(mobject):
+    """Gets the structure and plain attributes of a mobject family as JSON, and its
+    points, colors and other numeric arrays."""
+
+    family = mobject.get_family()
+    index = {id(mob): i for i, mob in enumerate(family)}
+    nodes, arrays = [], {}
+    for i, mob in enumerate(family):
+        node = {"class": type(mob).__name__, "attrs": {}, "groups": {}}
+        for name, value in vars(mob).items():
+            if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+                arrays[f"{i}.{name}"] = value
+            elif _is_plain(value):
+                node["attrs"][name] = value
+            elif (
+                isinstance(value, Mobject)
+                and id(value) not in index
+                and all(id(sub) in index for sub in value.submobjects)
+            ):
+                # groups of family members such as Text.chars
+                node["groups"][name] = [index[id(sub)] for sub in value.submobjects]
+        node["submobjects"] = [index[id(sub)] for sub in mob.submobjects]
+        nodes.append(node)
+    return json.dumps(nodes), arrays
+
+
+def _family_from_data(nodes, arrays):
+    """Rebuilds a mobject family from the data of _family_data."""
+
+    family = []
+    for node in json.loads(nodes):
+        mob = VMobject()
+        # only manim's own VMobject classes are restored, and without running them
+        cls = globals().get(node["class"])
+        if isinstance(cls, type) and issubclass(cls, VMobject):
+            mob.__class__ = cls
+        vars(mob).update(node["attrs"])
+        family.append((mob, node))
+    for name, array in arrays.items():
+        i, attr = name.split(".", 1)
+        vars(family[int(i)][0])[attr] = array
+    for mob, node in family:
+        mob.submobjects = [family[i][0] for i in node["submobjects"]]
+        for name, indices in node["groups"].items():
+            vars(mob)[name] = VGroup(*(family[i][0] for i in indices))
+    return family[0][0]
+
+
+class _TextCache:
+    """Least recently used cache of typeset mobjects, in memory and on disk.
+
+    Entries are content addressed by a SHA-256 of their key and the manim version,
+    so parallel render processes pointed at the same directory share them. Files hold
+    only the points, colors and plain attributes of a mobject family in .npz format,
+    and the mobject is rebuilt from them, so no code runs from the directory. Files
+    are written through a temporary file and an atomic rename under a file lock, so
+    readers never see a partial file, and the least recently used files are evicted
+    above a size cap in bytes. The directory defaults to MSCENE_CACHE_DIR or ~/.cache/mscene/text.
+    """
+
+    def __init__(self, directory=None, maxsize=256, maxbytes=2**28):
+        if directory is None:
+            directory = os.environ.get("MSCENE_CACHE_DIR")
+        if directory is None:
+            directory = Path.home() / ".cache" / "mscene" / "text"
+        self.directory = Path(directory)
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._mobjects = OrderedDict()
+        self._version = version("manim")
+
+    def get(self, key, func):
+        """Gets a copy of the mobject for key, calling func to build it on a miss."""
+
+        digest = hashlib.sha256(repr((self._version, key)).encode()).hexdigest()
+
+        if digest in self._mobjects:
+            self.hits += 1
+            self._mobjects.move_to_end(digest)
+            return self._mobjects[digest].copy()
+
+        path = self.directory / f"{digest}.npz"
+        mobject = self._read(path)
+        if mobject is None:
+            self.misses += 1
+            mobject = func()
+            self._write(path, mobject)
+        else:
+            self.disk_hits += 1
+
+        self._mobjects[digest] = mobject
+        while len(self._mobjects) > self.maxsize:
+            self._mobjects.popitem(last=False)
+
+        return mobject.copy()
+
+    def resize(self, maxbytes):
+        """Sets the disk size cap and evicts least recently used files above it."""
+
+        self.maxbytes = maxbytes
+        with self._lock():
+            self._evict()
+
+    def clear(self, disk=False):
+        """Removes the mobjects in memory, and the files too if disk, and resets the
+        statistics."""
+
+        self._mobjects.clear()
+        self.hits = self.disk_hits = self.misses = 0
+        if disk:
+            with self._lock():
+                for path in self.directory.glob("*.npz"):
+                    path.unlink(missing_ok=True)
+
+    def info(self):
+        """Returns hit and miss counts and memory and disk usage."""
+
+        files = list(self._files())
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self._mobjects),
+            "maxsize": self.maxsize,
+            "files": len(files),
+            "nbytes": sum(stat.st_size for _, stat in files),
+            "maxbytes": self.maxbytes,
+        }
+
+    def _read(self, path):
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            mobject = _family_from_data(str(arrays.pop("family")), arrays)
+        except Exception:
+            # missing, damaged or unreadable files are rebuilt
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return mobject
+
+    def _write(self, path, mobject):
+        try:
+            nodes, arrays = _family_data(mobject)
+        except Exception:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._lock():
+                fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as file:
+                        np.savez(file, family=np.array(nodes), **arrays)
+                    os.replace(tmp, path)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+                self._evict()
+        except OSError:
+            pass
+
+    def _files(self):
+        for path in self.directory.glob("*.npz"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        files = sorted(self._files(), key=lambda item: item[1].st_mtime)
+        nbytes = sum(stat.st_size for _, stat in files)
+        for path, stat in files:
+            if nbytes <= self.maxbytes:
+                break
+            path.unlink(missing_ok=True)
+            nbytes -= stat.st_size
+
+    @contextmanager
+    def _lock(self):
+        if fcntl is None or not self.directory.exists():
+            yield
+            return
+        with open(self.directory / ".lock", "a") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+text_cache = _TextCache()
+
+
+def _defaults(cls):
+    """Gets the keyword defaults of cls, including those changed with set_default on
+    it or a base class."""
+    defaults = {
+        name: param.default
+        for name, param in inspect.signature(cls).parameters.items()
+        if param.default is not param.empty
+    }
+    for base in reversed(cls.__mro__):
+        init, keywords = vars(base).get("__init__"), []
+        while isinstance(init, partialmethod):
+            keywords.append(init.keywords)
+            init = init.func
+        for kwargs in reversed(keywords):
+            defaults.update(kwargs)
+    return defaults
+
+
+def cached_text(text, font=None, weight=None, font_size=None, **kwargs):
+    """Returns a copy of Text that is laid out once per string, font, weight and size.
+
+    Pango layout and SVG parsing run only for text not built before, in this process
+    or in another one sharing text_cache's directory. Other Text options and the
+    defaults changed with Text.set_default are part of the key too.
+
+    Args:
+        text (str): The text string.
+        font (str | None): The font family. Defaults to the Text default.
+        weight (str | None): The font weight. Defaults to the Text default.
+        font_size (float | None): The font size. Defaults to the Text default.
+
+    Returns:
+        Text: A new Text mobject.
+
+    Examples:
+        label = cached_text("1×1", fill_opacity=2 / 3)
+        text_cache.clear()
+    """
+    defaults = _defaults(Text)
+    font, weight, font_size = (
+        defaults[name] if value is None else value
+        for name, value in zip(
+            ("font", "weight", "font_size"), (font, weight, font_size)
+        )
+    )
+    key = (
+        "Text",
+        text,
+        font,
+        weight,
+        font_size,
+        sorted(kwargs.items()),
+        sorted(defaults.items()),
+    )
+
+    return text_cache.get(
+        key,
+        lambda: Text(text, font=font, weight=weight, font_size=font_size, **kwargs),
+    )
+
+
+def _cached_tex(cls, tex_strings, kwargs):
+    defaults = _defaults(cls)
+    template = defaults.pop("tex_template", None) or config.tex_template
+    template = kwargs.get("tex_template") or template
+    options = sorted((k, v) for k, v in kwargs.items() if k != "tex_template")
+    key = (
+        cls.__name__,
+        tex_strings,
+        (template.body, template.tex_compiler, template.output_format),
+        options,
+        sorted(defaults.items()),
+    )
+
+    return text_cache.get(key, lambda: cls(*tex_strings, **kwargs))
+
+
+def cached_tex(*tex_strings, **kwargs):
+    """Returns a copy of Tex that is typeset once per source, template, options and
+    Tex defaults.
+
+    Examples:
+        title = cached_tex(r"Koch Curve")
+    """
+    return _cached_tex(Tex, tex_strings, kwargs)
+
+
+def cached_math_tex(*tex_strings, **kwargs):
+    """Returns a copy of MathTex that is typeset once per source, template, options
+    and MathTex defaults.
+
+    Examples:
+        formula = cached_math_tex(r"F_n = F_{n-1} + F_{n-2}")
+    """
+    return _cached_tex(MathTex, tex_strings, kwargs)
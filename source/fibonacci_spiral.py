@@ -1,4 +1,5 @@
 from manim import *
+from mscene.plugins import *
 
 __scenes__ = ["SceneOne", "SceneTwo", "SceneThree"]
 
@@ -18,66 +19,241 @@ def seq2str(seq):
     return seq_str
 
 
-def fib_spiral_mobj(seq, sf=1, add_dots=True):
-    """Returns Mobjects for Fibonacci spiral.
+def fib_place(edges, side, step):
+    """Returns the center of a square placed against the top, right, bottom or left
+    edge of a bounding box and centered along it, as next_to does, and the edges of
+    the box grown to hold it.
 
     Args:
-        seq (list[int]): List of Fibonacci numbers.
+        edges (tuple[float]): The top, right, bottom and left edges of the box.
+        side (float): The side length of the square.
+        step (int): The number of squares before it.
+    """
+    top, right, bottom, left = edges
+    half = side / 2
+    x, y = (left + right) / 2, (top + bottom) / 2
+    if step % 4 == 0:
+        y = top + half
+    elif step % 4 == 1:
+        x = right + half
+    elif step % 4 == 2:
+        y = bottom - half
+    else:
+        x = left - half
+
+    # a square longer than the side it is placed against widens the box too
+    edges = (
+        max(top, y + half),
+        max(right, x + half),
+        min(bottom, y - half),
+        min(left, x - half),
+    )
+    return np.array([x, y, 0.0]), edges
 
-    Returns:
-        VGroup: A group of Mobjects:
-                Square, Text, ArcBetweenPoints and Dot.
+
+def fib_layout(sides):
+    """Returns the centers of squares placed in turn against the top, right, bottom
+    and left of the squares before them, as the Fibonacci spiral does.
+
+    Only the four edges of the bounding box are kept, so each square is placed in
+    constant time.
+    """
+    centers = np.zeros((len(sides), 3))
+    # the first square sits on the origin
+    edges = (0.0, 0.0, 0.0, 0.0)
+    for i, side in enumerate(sides):
+        centers[i], edges = fib_place(edges, float(side), i)
+    return centers
+
+
+def fib_corners(centers, sides, steps):
+    """Returns the dot corners of Fibonacci squares and the ends of their arcs.
+
+    Dots sit on opposite corners and each arc runs clockwise between them.
     """
+    steps = np.asarray(steps)
+    corners = np.where((steps % 2 == 0)[:, None], DL, UL) * sides[:, None] / 2
+    starts = np.where((steps % 4 < 2)[:, None], corners, -corners) + centers
+    ends = 2 * centers - starts
+    dot_points = np.stack([centers + corners, centers - corners], axis=1)
+    return dot_points, starts, ends
+
+
+def fib_term_mobj(n, side, center, dot_points, start, end, add_dots=True, add_arc=True):
+    """Returns the square, label, arc and dots of one Fibonacci spiral term."""
 
     sqr_clr, dot_clr, sprl_clr = [
         ManimColor(hex) for hex in ("#214761", "#cfff04", "#04d9ff")
     ]
 
-    mobjects = VGroup()
-    squares = VGroup()
-
-    direction = (UP, RIGHT, DOWN, LEFT)
-    corner = (DL, UL)
-    dot_index = (0, 0, -1, -1)
+    square = Square(side, stroke_width=6, color=sqr_clr).move_to(center)
 
-    for i, n in enumerate(seq):
-        square = Square(n * sf, stroke_width=6, color=sqr_clr).next_to(
-            squares, direction[i % 4], buff=0
-        )
+    dots = VGroup(*(Dot(point, color=dot_clr) for point in dot_points))
 
-        dots = VGroup(
-            Dot(square.get_corner(corner[i % 2]), color=dot_clr),
-            Dot(square.get_corner(-corner[i % 2]), color=dot_clr),
-        )
+    num = (
+        cached_text(f"{n}×{n}", fill_opacity=2 / 3)
+        .scale_to_fit_width(square.width * 0.5)
+        .move_to(square)
+    )
 
+    vgroup = VGroup(square, num)
+    if add_arc:
         spiral = ArcBetweenPoints(
-            dots[dot_index[i % 4]].get_center(),
-            dots[dot_index[i % 4] + 1].get_center(),
+            start,
+            end,
             angle=-PI / 2,
             color=sprl_clr,
             stroke_width=6,
         )
-        num = (
-            Text(f"{n}×{n}", fill_opacity=2 / 3)
-            .scale_to_fit_width(square.width * 0.5)
-            .move_to(square)
-        )
+        vgroup.add(spiral)
+    if add_dots:
+        vgroup.add(dots)
+
+    vgroup[1:].set_z_index(1)
+
+    return vgroup
 
-        squares.add(square)
 
-        if add_dots:
+def fib_spiral_path(starts, ends):
+    """Returns the quarter-arcs between starts and ends as one VMobject.
 
-            vgroup = VGroup(square, num, spiral, dots)
-        else:
-            vgroup = VGroup(square, num, spiral)
+    The Bézier points of a unit clockwise quarter-arc are mapped onto every chord
+    with a complex multiply, so all arcs are placed in one pass.
+    """
+    sprl_clr = ManimColor("#04d9ff")
+
+    arc = Arc(angle=-PI / 2).points
+    z = arc[:, 0] + 1j * arc[:, 1]
+    # the unit arc runs from 1 to -1j, so its chord is -1 - 1j
+    chords = (ends[:, 0] - starts[:, 0]) + 1j * (ends[:, 1] - starts[:, 1])
+    scales = (chords / (-1 - 1j))[:, None]
+    w = (starts[:, 0] + 1j * starts[:, 1])[:, None] + scales * (z - 1)
+
+    points = np.zeros((w.size, 3))
+    points[:, 0] = w.real.ravel()
+    points[:, 1] = w.imag.ravel()
+    points[:, 2] = np.repeat(starts[:, 2], len(z))
+
+    spiral = VMobject(color=sprl_clr, stroke_width=6).set_points(points)
+    spiral.set_z_index(1)
 
-        vgroup[1:].set_z_index(1)
-        mobjects.add(vgroup)
-        mobjects.center()
+    return spiral
+
+
+def fib_spiral_mobj(seq, sf=1, add_dots=True, single_path=False):
+    """Returns Mobjects for Fibonacci spiral.
+
+    Args:
+        seq (list[int]): List of Fibonacci numbers.
+        single_path (bool): Whether the arcs form one VMobject instead of one per term.
+
+    Returns:
+        VGroup: A group of Mobjects:
+                Square, Text, ArcBetweenPoints and Dot.
+                With single_path, a group of the terms without arcs and the spiral.
+    """
+
+    mobjects = VGroup()
+
+    sides = np.asarray(seq, dtype=float) * sf
+    centers = fib_layout(sides)
+    dot_points, starts, ends = fib_corners(centers, sides, np.arange(len(seq)))
+
+    for i, n in enumerate(seq):
+        mobjects.add(
+            fib_term_mobj(
+                n,
+                sides[i],
+                centers[i],
+                dot_points[i],
+                starts[i],
+                ends[i],
+                add_dots,
+                add_arc=not single_path,
+            )
+        )
+
+    if single_path:
+        mobjects = VGroup(mobjects, fib_spiral_path(starts, ends))
+
+    mobjects.center()
 
     return mobjects
 
 
+class FibonacciSpiral(VGroup):
+    """A Fibonacci spiral that grows one term at a time.
+
+    New terms are placed from the bounding box edges of the layout, and rescaling
+    moves every term with one affine transform, so nothing is rebuilt.
+
+    Args:
+        seq (list[int]): List of Fibonacci numbers.
+        sf (float): Scale factor of the squares.
+        add_dots (bool): Whether terms have dots on their arc ends.
+    """
+
+    def __init__(self, seq, sf=1, add_dots=True, **kwargs):
+        super().__init__(**kwargs)
+        self.seq = []
+        self.sf = sf
+        self.add_dots = add_dots
+        self.terms = []
+        # top, right, bottom and left edges of the unscaled layout
+        self._edges = (0.0, 0.0, 0.0, 0.0)
+        self._origin = ORIGIN.astype(float)
+
+        for n in seq:
+            self.append_term(n)
+        self.rescale(sf)
+
+    def append_term(self, n=None):
+        """Adds the next term against the side its step faces and returns it.
+
+        By default the term is the sum of the last two terms, or repeats a single one.
+        """
+        if n is None:
+            n = sum(self.seq[-2:])
+
+        step = len(self.seq)
+        center, self._edges = fib_place(self._edges, float(n), step)
+
+        side = n * self.sf
+        center = self._origin + center * self.sf
+        dot_points, starts, ends = fib_corners(center[None], np.array([side]), [step])
+        term = fib_term_mobj(
+            n, side, center, dot_points[0], starts[0], ends[0], self.add_dots
+        )
+
+        self.seq.append(n)
+        self.terms.append(term)
+        self.add(term)
+
+        return term
+
+    def rescale(self, sf):
+        """Scales the squares to the scale factor sf and centers the spiral.
+
+        Terms removed from the group are moved too, so they can be added back later.
+        """
+        top, right, bottom, left = self._edges
+        origin = -np.array([left + right, top + bottom, 0]) / 2 * sf
+        factor = sf / self.sf
+        shift = origin - self._origin * factor
+
+        # dots keep their radius, so they are moved instead of scaled
+        for term in self.terms:
+            term.scale(factor, about_point=ORIGIN).shift(shift)
+            if self.add_dots:
+                for dot in term[3]:
+                    dot.scale(1 / factor)
+
+        self.sf = sf
+        self._origin = origin
+
+        return self
+
+
 def text_spiral_anim(text):
     """Text animation that spirals in and out."""
     text_group = VGroup()
@@ -135,9 +311,9 @@ class SceneTwo(Scene):
         frame_sizes = (config.frame_width, config.frame_height)
         sf1 = frame_sizes[size % 2] / sum(seq[-2:]) * 0.75
         sf2 = frame_sizes[1] * 0.5
-        mobj1 = fib_spiral_mobj(seq, sf1, add_dots=False)
-        mobj2 = fib_spiral_mobj(seq, sf2, add_dots=False)
-        point = mobj2.get_center() - mobj2[0].get_center()
+        mobj1 = fib_spiral_mobj(seq, sf1, add_dots=False, single_path=True)
+        mobj2 = fib_spiral_mobj(seq, sf2, add_dots=False, single_path=True)
+        point = mobj2.get_center() - mobj2[0][0].get_center()
         mobj2.move_to(point)
         mobj1.save_state()
         self.add(mobj1)
@@ -157,20 +333,20 @@ class SceneThree(Scene):
         seq = fib_seq(i, 1)
         frame_sizes = (config.frame_width, config.frame_height)
         sf = frame_sizes[i % 2] / sum(seq[-2:]) * 0.75
-        mobj = fib_spiral_mobj(seq, sf, add_dots=False)
+        mobj = FibonacciSpiral(seq, sf, add_dots=False)
         anim_in = [(FadeIn(i[0]), Write(i[1]), Create(i[2])) for i in mobj]
         self.play(*anim_in)
         self.wait()
 
         for j in range(i + 1, n + 1):
-            seq = fib_seq(j, 1)
-            sf = frame_sizes[j % 2] / sum(seq[-2:]) * 0.75
-            _mobj = fib_spiral_mobj(seq, sf, add_dots=False)
-            # transforms existing elements and then adds new ones
-            self.play(ReplacementTransform(mobj, _mobj[:-1]))
-            self.play(FadeIn(_mobj[-1][0]), Write(_mobj[-1][1]), Create(_mobj[-1][2]))
+            # places the new term, rescales the existing ones and then shows it
+            term = mobj.append_term()
+            mobj.remove(term)
+            sf = frame_sizes[j % 2] / sum(mobj.seq[-2:]) * 0.75
+            self.play(mobj.animate.rescale(sf))
+            mobj.add(term)
+            self.play(FadeIn(term[0]), Write(term[1]), Create(term[2]))
             self.wait()
-            mobj = _mobj
 
         anim_out = [(FadeOut(i[0]), Unwrite(i[1]), Uncreate(i[2])) for i in mobj]
         self.wait()
@@ -66,7 +66,7 @@ class KochCurveScene(Scene):
         for level in levels:
             self.play(
                 kc.animate(run_time=1.5).new_level(level, stroke_width=8 - level),
-                Transform(title[-1], Text(str(level)).move_to(title[-1])),
+                Transform(title[-1], cached_text(str(level)).move_to(title[-1])),
             )
             self.wait()
 
@@ -87,7 +87,7 @@ class SnowflakeScene(Scene):
         for level in levels:
             self.play(
                 ks.animate(run_time=1.5).new_level(level),
-                Transform(title[-1], Text(str(level)).move_to(title[-1])),
+                Transform(title[-1], cached_text(str(level)).move_to(title[-1])),
             )
             self.wait()
 
@@ -108,7 +108,7 @@ class AntisnowflakeScene(Scene):
         for level in levels:
             self.play(
                 ks.animate(run_time=1.5).new_level(level),
-                Transform(title[-1], Text(str(level)).move_to(title[-1])),
+                Transform(title[-1], cached_text(str(level)).move_to(title[-1])),
             )
             self.wait()
 
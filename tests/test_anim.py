@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from manim import *
+
+from mscene.plugins import *
+
+
+def _dash_ends(flow):
+    return [
+        (dash.points[0], dash.points[-1]) if len(dash.points) else None
+        for dash in flow._dashes
+    ]
+
+
+def _assert_same_dashes(flow, other):
+    for a, b in zip(_dash_ends(flow), _dash_ends(other), strict=True):
+        assert (a is None) == (b is None)
+        if a is not None:
+            np.testing.assert_allclose(a, b, atol=1e-9)
+
+
+def _flows(offset):
+    return [
+        DashFlow(Line(LEFT * 3, RIGHT * 2), dash_offset=offset),
+        DashFlow(Circle(), dash_offset=offset),
+        DashFlow(Square(), num_dashes=5, dash_offset=offset, equal_lengths=False),
+        DashFlow(Arc(angle=4), num_dashes=7, dashed_ratio=0.3, dash_offset=offset),
+        DashFlow(Circle(radius=3), num_dashes=9, dash_offset=offset),
+    ]
+
+
+@pytest.mark.parametrize("offset", [0, 0.25, 0.5, 0.75, 0.9])
+def test_dash_flow_group_matches_dash_flow(offset):
+    solo = _flows(offset)
+    group = DashFlowGroup(*_flows(offset)).update_dashes()
+
+    for flow, other in zip(solo, group.flows, strict=True):
+        _assert_same_dashes(flow, other)
+
+
+def test_dash_flow_group_copy_moves_dashes():
+    group = DashFlowGroup(*_flows(0)).update_dashes()
+    copy = group.copy()
+    group.update_dashes(0.3)
+    copy.update_dashes(0.3)
+
+    for flow, other in zip(group.flows, copy.flows, strict=True):
+        _assert_same_dashes(flow, other)
+
+
+@pytest.mark.parametrize("mode", [IN, OUT, None])
+def test_flash_fade_draws_flash_above_parts(mode):
+    # the flash used to be a ShowPassingFlash per part, introduced on top of
+    # the scene after its part, so it stays above the parts and the rest
+    scene = Scene()
+    vmob = VGroup(Square(), Triangle())
+    if mode is OUT:
+        scene.add(Circle(), vmob, Circle())
+    else:
+        scene.add(Circle(), Circle())
+    animation = FlashFade(vmob, mode=mode)
+    scene.add_mobjects_from_animations([animation])
+    animation._setup_scene(scene)
+
+    order = [id(mob) for mob in scene.mobjects]
+    assert order[-1] == id(animation.flash)
+    assert order.index(id(animation.mobject)) < order.index(id(animation.flash))
@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "source"))
+
+from fibonacci_spiral import *
+
+SEQUENCES = [
+    (fib_seq(8), 1),
+    (fib_seq(6, 1, 2), 0.3),
+    ([2, 3, 5, 8, 13], 1),
+    (fib_seq(12, 1), 0.5),
+]
+
+
+def _next_to_centers(sides):
+    """Lays out the squares with next_to, as fib_spiral_mobj used to."""
+    squares = VGroup()
+    for i, side in enumerate(sides):
+        direction = (UP, RIGHT, DOWN, LEFT)[i % 4]
+        squares.add(Square(side).next_to(squares, direction, buff=0))
+    return np.array([square.get_center() for square in squares])
+
+
+@pytest.mark.parametrize("seq, sf", SEQUENCES)
+def test_fib_layout_matches_next_to(seq, sf):
+    sides = np.array(seq, dtype=float) * sf
+    np.testing.assert_allclose(fib_layout(sides), _next_to_centers(sides), atol=1e-9)
+
+
+@pytest.mark.parametrize("seq, sf", SEQUENCES)
+def test_append_term_matches_fib_layout(seq, sf, monkeypatch):
+    monkeypatch.setattr(
+        sys.modules["fibonacci_spiral"], "cached_text", lambda text, **kwargs: Dot()
+    )
+    spiral = FibonacciSpiral(seq[:2], sf)
+    for n in seq[2:]:
+        spiral.append_term(n)
+    spiral.rescale(sf)
+
+    squares = VGroup(*(term[0] for term in spiral.terms))
+    centers = np.array([square.get_center() for square in squares])
+    expected = fib_layout(np.array(seq, dtype=float) * sf)
+    np.testing.assert_allclose(centers - centers[0], expected - expected[0], atol=1e-9)
+    np.testing.assert_allclose(squares.get_center(), ORIGIN, atol=1e-9)
@@ -0,0 +1,164 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from manim import *
+
+from mscene import fractal
+from mscene.plugins import *
+
+
+def _legacy_koch_curve(level, length, point, group):
+    # the copy, rotate and arrange build that KochCurve used to run
+    step = length / 3**level
+    vmob = VMobject().set_points_as_corners([LEFT * step / 2, RIGHT * step / 2])
+    for _ in range(level):
+        new_vmob = VGroup()
+        for i in (0, PI / 3, -PI / 3, 0):
+            new_vmob.add(vmob.copy().rotate(i))
+        new_vmob.arrange(RIGHT, buff=0, aligned_edge=DOWN)
+        vmob.become(new_vmob)
+    vmob.move_to(point)
+    return VMobject().set_points(vmob.get_all_points()) if group else vmob
+
+
+def _assert_same_nesting(vmob, expected):
+    assert len(vmob.submobjects) == len(expected.submobjects)
+    np.testing.assert_allclose(vmob.points, expected.points, atol=1e-9)
+    for sub, expected_sub in zip(vmob.submobjects, expected.submobjects):
+        _assert_same_nesting(sub, expected_sub)
+
+
+@pytest.mark.parametrize("level", range(5))
+@pytest.mark.parametrize("group", [True, False])
+def test_koch_curve_matches_the_legacy_build(level, group):
+    length, point = 5, np.array([1.5, -0.5, 0])
+    curve = KochCurve(level, length, point, group=group)
+    expected = _legacy_koch_curve(level, length, point, group)
+
+    _assert_same_nesting(curve, expected)
+    np.testing.assert_allclose(curve.get_center(), point, atol=1e-9)
+
+
+def test_update_lod_keeps_flip_and_stretch():
+    def transform(vmob):
+        return vmob.flip(RIGHT).rotate(0.7).stretch(0.3, 1).scale(0.03)
+
+    curve = transform(KochCurve(5, lod=True)).update_lod()
+    assert curve.lod_level < 5
+
+    expected = transform(KochCurve(curve.lod_level))
+    np.testing.assert_allclose(curve.points, expected.points, atol=1e-9)
+
+
+def test_hilbert_curve_keeps_its_size():
+    for level in range(6):
+        curve = HilbertCurve(level, length=4)
+        assert np.isclose(curve.width, 4) and np.isclose(curve.height, 4)
+
+
+def test_compact_segments_are_submobjects_of_the_curve():
+    curve = KochCurve(2, group=False, compact=True)
+    part = curve[1]
+
+    assert isinstance(part, VMobject)
+    assert all(any(run is sub for sub in curve.submobjects) for run in part.submobjects)
+    with pytest.raises(IndexError):
+        part[2][0]
+
+    animation = part.animate.set_color(RED).build()
+    animation.begin()
+    animation.finish()
+    assert curve[1][3].get_color() == RED
+    assert curve[0].get_color() != RED
+
+
+def test_transform_keeps_the_outer_pieces_in_place():
+    high = KochCurve(2)
+    low = KochCurve(1).shift(high.points[0] - KochCurve(1).points[0])
+    animation = Transform(low, high)
+    animation.begin()
+    animation.interpolate(0.5)
+
+    # the outer thirds of every level 1 step are level 2 steps already
+    for piece in range(0, 16, 4):
+        for i in piece, piece + 3:
+            curve = slice(4 * i, 4 * i + 4)
+            np.testing.assert_allclose(low.points[curve], high.points[curve], atol=1e-9)
+
+
+def _rewrite_turns(axiom, rules, level, draw):
+    text = axiom
+    for _ in range(level):
+        text = "".join(rules.get(a, a) for a in text)
+    turns = np.cumsum([(a == "+") - (a == "-") for a in text])
+    return np.array([t for a, t in zip(text, turns) if a in draw], dtype=int)
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        KochCurve,
+        KochSnowflake,
+        SierpinskiArrowhead,
+        DragonCurve,
+        LevyCurve,
+        HilbertCurve,
+    ],
+)
+def test_expanded_turns_match_string_rewriting(cls):
+    for level in range(6):
+        turns = fractal._expand_turns(cls.axiom, cls.rules, level, cls.draw)
+        expected = _rewrite_turns(cls.axiom, cls.rules, level, cls.draw)
+        np.testing.assert_array_equal(turns, expected)
+
+
+def test_compact_segment_copies_are_detached_views():
+    curve = KochCurve(2, group=False, compact=True)
+    view = curve[1]
+    copy = view.copy().set_color(RED)
+
+    assert type(copy) is type(view)
+    assert copy.get_color() == RED
+    assert curve[1].get_color() == WHITE
+
+
+def _play(animation):
+    animation.begin()
+    animation.finish()
+
+
+def test_compact_segments_follow_a_transform():
+    curve = KochCurve(2, group=False, compact=True)
+    _play(curve[1].animate.set_color(RED).build())
+    assert curve[1].get_color() == RED and curve[0].get_color() == WHITE
+
+    target = KochCurve(3, group=False, compact=True)
+    target[2].set_color(BLUE)
+    _play(Transform(curve, target))
+
+    assert len(curve.segment_widths) == 64
+    assert len(curve[2]) == 4
+    assert curve[2][3].get_color() == BLUE and curve[1].get_color() == WHITE
+
+
+def test_export_writes_the_drawn_level_after_a_transform(tmp_path):
+    curve, target = KochCurve(1), KochCurve(3)
+    _play(Transform(curve, target))
+
+    points = np.load(curve.export(str(tmp_path / "curve.npy")))
+    np.testing.assert_allclose(points, target.points, atol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["2", "curve.txt"], ["-1", "curve.npy"], ["2", "curve.npy", "--chunk-size", "0"]],
+)
+def test_cli_reports_invalid_arguments_with_usage(args, tmp_path):
+    command = [sys.executable, "-m", "mscene.fractal", "KochCurve", *args]
+    result = subprocess.run(command, cwd=tmp_path, capture_output=True, text=True)
+
+    assert result.returncode == 2
+    assert result.stderr.startswith("usage:") and "Traceback" not in result.stderr
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from manim import *
+
+from mscene.plugins import *
+
+
+def _square_gap(center):
+    """Gets the distance from a point to the boundary of Square(4)."""
+    if np.all(np.abs(center[:2]) <= 2):
+        return (2 - np.abs(center[:2])).min()
+    return np.linalg.norm(center - np.clip(center, -2, 2))
+
+
+@pytest.mark.parametrize("point", [UP * 3 + RIGHT * 0.4, UP + RIGHT * 0.4])
+def test_roll_along_square_keeps_wheel_off_path(point):
+    wheel = Wheel(radius=1, markers=[(1, 0)], point=point)
+    roll = wheel.roll_along(Square(4), 0.1, 0.9)
+    roll.begin()
+
+    centers = []
+    for alpha in np.linspace(0, 1, 400):
+        roll.interpolate(alpha)
+        centers.append(wheel.dot.get_center())
+    centers = np.array(centers)
+
+    # the wheel touches the square without crossing it, and never jumps
+    assert min(_square_gap(center) for center in centers) > 1 - 1e-2
+    assert np.linalg.norm(np.diff(centers, axis=0), axis=1).max() < 0.05
+
+
+def test_sampled_roll_keeps_markers_on_the_wheel():
+    wheel = Wheel(radius=1, markers=[(1, 0), (0.5, 2)], point=RIGHT * 4)
+    roll = wheel.roll(PI, about=Circle(radius=3), samples=5)
+    roll.begin()
+
+    for alpha in np.linspace(0, 1, 50):
+        roll.interpolate(alpha)
+        center = wheel.dot.get_center()
+        for marker in wheel.markers:
+            distance = np.linalg.norm(marker.dot.get_center() - center)
+            assert distance == pytest.approx(marker.distance)
+
+
+def test_ring_traced_path_takes_traced_path_arguments():
+    dot = Dot()
+    path = RingTracedPath(dot.get_center, dissipating_time=0.5, stroke_opacity=[0, 1])
+    assert path.capacity == int(np.ceil(0.5 * config.frame_rate))
+
+    for _ in range(3 * path.capacity):
+        dot.shift(RIGHT * 0.01)
+        path.update(1 / config.frame_rate)
+    assert len(path.points) == 4 * path.capacity
+
+    paths = Wheel(markers=[(1, 0)]).trace_paths(capacity=10, dissipating_time=0.5)
+    assert paths[0].capacity == 10
@@ -0,0 +1,25 @@
+import numpy as np
+from manim import *
+
+from mscene import text
+
+
+def test_text_cache_rebuilds_mobjects_from_plain_data(tmp_path):
+    path = tmp_path / "a.svg"
+    path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">'
+        '<path d="M0 0 L10 0 L10 10 Z" fill="red"/>'
+        '<path d="M0 5 L5 5" stroke="blue"/></svg>'
+    )
+    cache = text._TextCache(tmp_path / "cache")
+    mobject = cache.get("svg", lambda: SVGMobject(path))
+    cache.clear()
+    loaded = cache.get("svg", lambda: None)
+
+    assert cache.info()["disk_hits"] == 1
+    assert [p.suffix for p in cache.directory.glob("?*.*")] == [".npz"]
+    for a, b in zip(mobject.get_family(), loaded.get_family(), strict=True):
+        assert type(a) is type(b)
+        np.testing.assert_array_equal(a.points, b.points)
+        assert a.get_fill_color() == b.get_fill_color()
+        assert a.get_stroke_color() == b.get_stroke_color()